@@ -13,6 +13,7 @@ from typing import Any
 import httpx
 
 from .config import OnvifCameraConfig
+from .http_client import create_http_client, get_shared_http_client
 from .logging_config import log_debug
 
 
@@ -164,16 +165,23 @@ class AxisConfigClient:
         self,
         config: OnvifCameraConfig,
         timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the AXIS config client.
 
         Args:
             config: Camera configuration with IP and credentials.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared HTTP client. If not provided, the
+                client from `shared_http_client()` is used when active,
+                otherwise a dedicated client is created.
         """
         self.config = config
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        self._http_client = http_client
+        self._owns_client = False
+        self._auth: httpx.DigestAuth | None = None
 
     async def __aenter__(self) -> "AxisConfigClient":
         """Async context manager entry."""
@@ -186,18 +194,21 @@ class AxisConfigClient:
             f"with username='{username}' "
             f"(using {'axis_username' if is_axis_creds else 'ONVIF username'} credentials)"
         )
-        self._client = httpx.AsyncClient(
-            auth=httpx.DigestAuth(username, password),
-            timeout=self.timeout,
-            verify=False,  # AXIS cameras often use self-signed certs
-        )
+        self._auth = httpx.DigestAuth(username, password)
+        shared = self._http_client or get_shared_http_client()
+        if shared is not None:
+            self._client = shared
+            self._owns_client = False
+        else:
+            self._client = create_http_client(self.timeout)
+            self._owns_client = True
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     @property
     def base_url(self) -> str:
@@ -237,7 +248,9 @@ class AxisConfigClient:
         client = self._ensure_connected()
         url = f"{self.base_url}/{path}" if path else self.base_url
 
-        response = await client.get(url, headers={"accept": "application/json"})
+        response = await client.get(
+            url, headers={"accept": "application/json"}, auth=self._auth, timeout=self.timeout
+        )
         response.raise_for_status()
 
         data = response.json()
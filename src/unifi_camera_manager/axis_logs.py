@@ -17,8 +17,9 @@ from enum import Enum
 import httpx
 
 from .config import OnvifCameraConfig
+from .http_client import create_http_client, get_shared_http_client
 from .logging_config import log_debug
-from .models import LogEntry, LogLevel, LogReport, LogType
+from .models import LOG_LEVEL_MAP, LogEntry, LogLevel, LogReport, LogType
 
 
 def _parse_log_level(level_str: str) -> LogLevel:
@@ -30,18 +31,7 @@ def _parse_log_level(level_str: str) -> LogLevel:
     Returns:
         Matching LogLevel enum value, or LogLevel.INFO as default.
     """
-    level_lower = level_str.lower()
-    try:
-        return LogLevel(level_lower)
-    except ValueError:
-        # Map common syslog levels to our enum
-        mappings = {
-            "warn": LogLevel.WARNING,
-            "err": LogLevel.ERROR,
-            "crit": LogLevel.CRITICAL,
-            "emerg": LogLevel.EMERGENCY,
-        }
-        return mappings.get(level_lower, LogLevel.INFO)
+    return LOG_LEVEL_MAP.get(level_str.lower(), LogLevel.INFO)
 
 
 class ServerReportMode(str, Enum):
@@ -178,16 +168,23 @@ class AxisLogClient:
         self,
         config: OnvifCameraConfig,
         timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the AXIS log client.
 
         Args:
             config: Camera configuration with IP and credentials.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared HTTP client. If not provided, the
+                client from `shared_http_client()` is used when active,
+                otherwise a dedicated client is created.
         """
         self.config = config
         self.timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        self._http_client = http_client
+        self._owns_client = False
+        self._auth: httpx.DigestAuth | None = None
 
     async def __aenter__(self) -> "AxisLogClient":
         """Async context manager entry."""
@@ -200,18 +197,21 @@ class AxisLogClient:
             f"with username='{username}' "
             f"(using {'axis_username' if is_axis_creds else 'ONVIF username'} credentials)"
         )
-        self._client = httpx.AsyncClient(
-            auth=httpx.DigestAuth(username, password),
-            timeout=self.timeout,
-            verify=False,  # AXIS cameras often use self-signed certs
-        )
+        self._auth = httpx.DigestAuth(username, password)
+        shared = self._http_client or get_shared_http_client()
+        if shared is not None:
+            self._client = shared
+            self._owns_client = False
+        else:
+            self._client = create_http_client(self.timeout)
+            self._owns_client = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
         """Async context manager exit."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     @property
     def base_url(self) -> str:
@@ -257,7 +257,7 @@ class AxisLogClient:
         if mode != ServerReportMode.TEXT:
             params["mode"] = mode.value
 
-        response = await client.get(url, params=params)
+        response = await client.get(url, params=params, auth=self._auth, timeout=self.timeout)
         response.raise_for_status()
         return response.content
 
@@ -6,24 +6,27 @@ PTZ control, image settings, and log retrieval.
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import os
+import shlex
+import signal
+import sys
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-import httpx
 import typer
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
 
-from .axis_config import AxisConfigClient
-from .axis_diagnostics import AxisDiagnosticsClient
-from .axis_lldp import AxisLLDPClient
-from .axis_logs import AxisLogClient, get_camera_logs
-from .client import get_protect_client
 from .config import (
     OnvifCameraConfig,
     ProtectConfig,
@@ -31,19 +34,18 @@ from .config import (
     get_camera_by_ip,
     get_camera_by_name,
     get_default_credentials,
-    list_camera_names,
     load_cameras_config,
     protect_camera_id_completion,
     save_protect_cameras_cache,
 )
 from .logging_config import configure_global_logger, log_debug, log_error, log_info
-from .models import LogType, PTZDirection
-from .onvif_discovery import (
-    check_camera_connectivity,
-    get_onvif_stream_uri,
-    verify_onvif_camera,
-)
-from .onvif_manager import OnvifCamera
+from .models import CameraInfo, LogType, OnvifCameraInfo, PTZDirection
+
+# uiprotect, onvif (zeep, aiohttp) and the httpx-based AXIS clients are slow to
+# import, so each command imports the client it needs locally
+if TYPE_CHECKING:
+    from .client import UnifiProtectClient
+    from .onvif_manager import OnvifCameraManager
 
 # Configure root logger to WARNING by default to suppress third-party INFO logs
 # This can be overridden with --log-level when --log-file is specified
@@ -54,8 +56,85 @@ logging.basicConfig(level=logging.WARNING, format="%(levelname)s:%(name)s:%(mess
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-# Console for rich output
-console = Console()
+# Console for rich output. When stdout is piped (scripts, CI) styles are not
+# emitted, so also skip the per-print highlighting and emoji regex passes.
+_interactive = sys.stdout.isatty()
+console = Console(highlight=_interactive, emoji=_interactive)
+
+# Shared runner so all commands in one process reuse a single event loop
+_runner: asyncio.Runner | None = None
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get uvloop's faster event loop factory when it is installed.
+
+    Returns:
+        uvloop.new_event_loop, or None to use the default asyncio loop.
+    """
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def _get_runner() -> asyncio.Runner:
+    """Get the shared asyncio runner, creating it on first use.
+
+    Returns:
+        Runner whose event loop is reused by every command in the process.
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(loop_factory=_loop_factory())
+        atexit.register(_close_runner)
+    return _runner
+
+
+def _close_runner() -> None:
+    """Close the shared asyncio runner and its event loop, if open."""
+    global _runner
+    if _runner is not None:
+        _runner.close()
+        _runner = None
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared event loop.
+
+    Replaces per-command `asyncio.run()` so the loop (and any async
+    resources bound to it) survives across commands run in one process.
+
+    Args:
+        coro: Coroutine to run to completion.
+
+    Returns:
+        Result of the coroutine.
+    """
+    return _get_runner().run(coro)
+
+
+def run_axis_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run an AXIS command coroutine with a shared HTTP client.
+
+    AXIS API clients created while the coroutine runs reuse one pooled
+    httpx client instead of each opening their own.
+
+    Args:
+        coro: Coroutine to run to completion.
+
+    Returns:
+        Result of the coroutine.
+    """
+
+    async def _run() -> T:
+        from .http_client import shared_http_client
+
+        async with shared_http_client():
+            return await coro
+
+    return run_async(_run())
 
 
 def complete_camera_names(incomplete: str) -> list[str]:
@@ -84,6 +163,10 @@ def complete_log_types(incomplete: str) -> list[str]:
     return [t for t in types if t.startswith(incomplete.lower())]
 
 
+# PTZ `--move` values mapped to directions
+_PTZ_DIR_MAP: dict[str, PTZDirection] = {d.value: d for d in PTZDirection}
+
+
 def complete_ptz_directions(incomplete: str) -> list[str]:
     """Provide shell completion for PTZ directions.
 
@@ -93,8 +176,7 @@ def complete_ptz_directions(incomplete: str) -> list[str]:
     Returns:
         List of matching PTZ directions.
     """
-    directions = ["up", "down", "left", "right", "zoom_in", "zoom_out"]
-    return [d for d in directions if d.startswith(incomplete.lower())]
+    return [d for d in _PTZ_DIR_MAP if d.startswith(incomplete.lower())]
 
 
 def complete_protect_camera_ids(incomplete: str) -> list[str]:
@@ -179,6 +261,98 @@ def get_config(env_file: Path | None = None) -> ProtectConfig:
         raise typer.Exit(1) from e
 
 
+# Serializer for `--json` camera lists (pydantic-core, no Rich rendering)
+_camera_list_adapter = TypeAdapter(list[CameraInfo])
+
+# Precomputed camera table cells, keyed by flag
+_ADOPTED_CELL = {True: "[green]\u2713[/green]", False: "[red]\u2717[/red]"}
+_THIRD_PARTY_SUFFIX = {True: " [3P]", False: ""}
+
+
+def _info_grid(*rows: tuple[str, Any]) -> Table:
+    """Build a two-column label/value grid for an info panel.
+
+    Labels are plain Text styled bold, so only the values go through Rich's
+    markup parser. Rows with a None value are omitted.
+
+    Args:
+        *rows: (label, value) pairs in display order.
+
+    Returns:
+        Grid table suitable for wrapping in a Panel.
+    """
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(style="bold", no_wrap=True)
+    grid.add_column()
+    for label, value in rows:
+        if value is not None:
+            grid.add_row(Text(f"{label}:"), str(value))
+    return grid
+
+
+def _write_json(data: str) -> None:
+    """Write a JSON document straight to stdout, bypassing the Rich console.
+
+    Args:
+        data: Serialized JSON document.
+    """
+    sys.stdout.write(data + "\n")
+
+
+async def _list_impl(
+    client: "UnifiProtectClient",
+    show_third_party_only: bool,
+    as_json: bool = False,
+) -> None:
+    """Print the camera table and refresh the completion cache.
+
+    Args:
+        client: Connected Protect client.
+        show_third_party_only: Only show third-party cameras.
+        as_json: Write the cameras as a JSON array instead of a table.
+    """
+    if as_json:
+        cameras = [cam async for cam in client.iter_cameras(show_third_party_only)]
+        _write_json(_camera_list_adapter.dump_json(cameras).decode())
+        save_protect_cameras_cache(
+            [{"id": c.id, "name": c.name, "host": c.host or ""} for c in cameras]
+        )
+        return
+
+    nvr_info = await client.get_nvr_info()
+
+    console.print(f"\n[bold]NVR:[/bold] {nvr_info.name} ({nvr_info.version})")
+    console.print(f"[bold]Model:[/bold] {nvr_info.model}\n")
+
+    table = Table(title="Cameras")
+    table.add_column("Name", style="cyan")
+    table.add_column("Type", style="magenta")
+    table.add_column("IP Address", style="green")
+    table.add_column("Adopted", style="yellow")
+    table.add_column("State", style="blue")
+    table.add_column("ID", style="dim")
+
+    # Build table rows and the completion cache in a single pass
+    cache_data: list[dict[str, str]] = []
+    async for cam in client.iter_cameras(show_third_party_only):
+        host = cam.host or ""
+        table.add_row(
+            cam.name,
+            cam.type + _THIRD_PARTY_SUFFIX[cam.is_third_party],
+            host or "N/A",
+            _ADOPTED_CELL[cam.is_adopted],
+            cam.state,
+            cam.id,
+        )
+        cache_data.append({"id": cam.id, "name": cam.name, "host": host})
+
+    console.print(table)
+    console.print(f"\n[bold]Total:[/bold] {len(cache_data)} cameras")
+
+    # Save camera IDs to cache for shell completions
+    save_protect_cameras_cache(cache_data)
+
+
 @app.command("list")
 def list_cameras(
     env_file: Annotated[
@@ -193,6 +367,10 @@ def list_cameras(
         bool,
         typer.Option("--include-unadopted", "-u", help="Include unadopted devices"),
     ] = True,
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output cameras as JSON"),
+    ] = False,
 ) -> None:
     """List all cameras in UniFi Protect.
 
@@ -202,53 +380,49 @@ def list_cameras(
     config = get_config(env_file)
 
     async def _list() -> None:
+        from .client import get_protect_client
+
         async with get_protect_client(config, include_unadopted=show_unadopted) as client:
-            cameras = await client.list_cameras()
-            nvr_info = await client.get_nvr_info()
+            await _list_impl(client, show_third_party_only, as_json)
+
+    run_async(_list())
 
-            console.print(f"\n[bold]NVR:[/bold] {nvr_info.name} ({nvr_info.version})")
-            console.print(f"[bold]Model:[/bold] {nvr_info.model}\n")
 
-            if show_third_party_only:
-                cameras = [c for c in cameras if c.is_third_party]
+async def _info_impl(client: "UnifiProtectClient", camera_id: str, as_json: bool = False) -> None:
+    """Print detailed information about one camera.
 
-            table = Table(title="Cameras")
-            table.add_column("Name", style="cyan")
-            table.add_column("Type", style="magenta")
-            table.add_column("IP Address", style="green")
-            table.add_column("Adopted", style="yellow")
-            table.add_column("State", style="blue")
-            table.add_column("ID", style="dim")
+    Args:
+        client: Connected Protect client.
+        camera_id: Camera ID or IP address.
+        as_json: Write the camera as a JSON object instead of styled text.
 
-            for cam in cameras:
-                adopted_str = "\u2713" if cam.is_adopted else "\u2717"
-                adopted_style = "green" if cam.is_adopted else "red"
-                third_party_marker = " [3P]" if cam.is_third_party else ""
+    Raises:
+        typer.Exit: If the camera is not found.
+    """
+    # Try to find by ID first, then by IP
+    camera = await client.resolve_camera(camera_id)
 
-                table.add_row(
-                    cam.name,
-                    f"{cam.type}{third_party_marker}",
-                    str(cam.host) if cam.host else "N/A",
-                    f"[{adopted_style}]{adopted_str}[/{adopted_style}]",
-                    str(cam.state),
-                    cam.id,
-                )
+    if not camera:
+        console.print(f"[red]Camera not found:[/red] {camera_id}")
+        raise typer.Exit(1)
 
-            console.print(table)
-            console.print(f"\n[bold]Total:[/bold] {len(cameras)} cameras")
-
-            # Save camera IDs to cache for shell completions
-            cache_data = [
-                {
-                    "id": cam.id,
-                    "name": cam.name,
-                    "host": str(cam.host) if cam.host else "",
-                }
-                for cam in cameras
-            ]
-            save_protect_cameras_cache(cache_data)
+    if as_json:
+        _write_json(camera.model_dump_json())
+        return
 
-    asyncio.run(_list())
+    # Build the block first and print it in one call
+    lines = [
+        f"\n[bold cyan]Camera: {camera.name}[/bold cyan]",
+        f"  [bold]ID:[/bold] {camera.id}",
+        f"  [bold]Type:[/bold] {camera.type}",
+        f"  [bold]IP Address:[/bold] {camera.host or 'N/A'}",
+        f"  [bold]Adopted:[/bold] {'Yes' if camera.is_adopted else 'No'}",
+        f"  [bold]State:[/bold] {camera.state}",
+        f"  [bold]Third-Party:[/bold] {'Yes' if camera.is_third_party else 'No'}",
+    ]
+    if camera.last_seen:
+        lines.append(f"  [bold]Last Seen:[/bold] {camera.last_seen}")
+    console.print("\n".join(lines))
 
 
 @app.command("info")
@@ -264,6 +438,10 @@ def camera_info(
         Path | None,
         typer.Option("--env", "-e", help="Path to .env file"),
     ] = None,
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output camera as JSON"),
+    ] = False,
 ) -> None:
     """Get detailed information about a specific camera.
 
@@ -273,29 +451,40 @@ def camera_info(
     config = get_config(env_file)
 
     async def _info() -> None:
+        from .client import get_protect_client
+
         async with get_protect_client(config) as client:
-            # Try to find by ID first, then by IP
-            camera = await client.get_camera(camera_id)
-            if not camera:
-                camera = await client.get_camera_by_ip(camera_id)
-
-            if not camera:
-                console.print(f"[red]Camera not found:[/red] {camera_id}")
-                raise typer.Exit(1)
-
-            console.print(f"\n[bold cyan]Camera: {camera.name}[/bold cyan]")
-            console.print(f"  [bold]ID:[/bold] {camera.id}")
-            console.print(f"  [bold]Type:[/bold] {camera.type}")
-            console.print(
-                f"  [bold]IP Address:[/bold] {str(camera.host) if camera.host else 'N/A'}"
-            )
-            console.print(f"  [bold]Adopted:[/bold] {'Yes' if camera.is_adopted else 'No'}")
-            console.print(f"  [bold]State:[/bold] {str(camera.state)}")
-            console.print(f"  [bold]Third-Party:[/bold] {'Yes' if camera.is_third_party else 'No'}")
-            if camera.last_seen:
-                console.print(f"  [bold]Last Seen:[/bold] {camera.last_seen}")
+            await _info_impl(client, camera_id, as_json)
+
+    run_async(_info())
 
-    asyncio.run(_info())
+
+async def _adopt_impl(client: "UnifiProtectClient", camera_id: str) -> None:
+    """Adopt a camera if it is not already adopted.
+
+    Args:
+        client: Connected Protect client.
+        camera_id: Camera ID to adopt.
+
+    Raises:
+        typer.Exit: If the camera is not found or adoption fails.
+    """
+    camera = await client.get_camera(camera_id)
+    if not camera:
+        console.print(f"[red]Camera not found:[/red] {camera_id}")
+        raise typer.Exit(1)
+
+    if camera.is_adopted:
+        console.print(f"[yellow]Camera already adopted:[/yellow] {camera.name}")
+        return
+
+    console.print(f"Adopting camera: [cyan]{camera.name}[/cyan] ({camera_id})...")
+    try:
+        await client.adopt_camera(camera_id)
+        console.print("[green]\u2713[/green] Adoption initiated successfully")
+    except RuntimeError as e:
+        console.print(f"[red]\u2717[/red] {e}")
+        raise typer.Exit(1) from e
 
 
 @app.command("adopt")
@@ -320,25 +509,46 @@ def adopt_camera(
     config = get_config(env_file)
 
     async def _adopt() -> None:
+        from .client import get_protect_client
+
         async with get_protect_client(config) as client:
-            camera = await client.get_camera(camera_id)
-            if not camera:
-                console.print(f"[red]Camera not found:[/red] {camera_id}")
-                raise typer.Exit(1)
+            await _adopt_impl(client, camera_id)
+
+    run_async(_adopt())
 
-            if camera.is_adopted:
-                console.print(f"[yellow]Camera already adopted:[/yellow] {camera.name}")
-                return
 
-            console.print(f"Adopting camera: [cyan]{camera.name}[/cyan] ({camera_id})...")
-            try:
-                await client.adopt_camera(camera_id)
-                console.print("[green]\u2713[/green] Adoption initiated successfully")
-            except RuntimeError as e:
-                console.print(f"[red]\u2717[/red] {e}")
-                raise typer.Exit(1) from e
+async def _unadopt_impl(client: "UnifiProtectClient", camera_id: str, force: bool) -> None:
+    """Unadopt a camera, asking for confirmation unless forced.
 
-    asyncio.run(_adopt())
+    Args:
+        client: Connected Protect client.
+        camera_id: Camera ID to unadopt.
+        force: Skip the confirmation prompt.
+
+    Raises:
+        typer.Exit: If the camera is not found, the prompt is declined, or unadoption fails.
+    """
+    camera = await client.get_camera(camera_id)
+    if not camera:
+        console.print(f"[red]Camera not found:[/red] {camera_id}")
+        raise typer.Exit(1)
+
+    if not force:
+        # Prompt off the event loop so other tasks keep running while waiting
+        confirm = await asyncio.to_thread(
+            typer.confirm, f"Are you sure you want to unadopt '{camera.name}'?"
+        )
+        if not confirm:
+            console.print("[yellow]Cancelled[/yellow]")
+            raise typer.Exit(0)
+
+    console.print(f"Unadopting camera: [cyan]{camera.name}[/cyan]...")
+    try:
+        await client.unadopt_camera(camera_id)
+        console.print("[green]\u2713[/green] Unadoption initiated successfully")
+    except RuntimeError as e:
+        console.print(f"[red]\u2717[/red] {e}")
+        raise typer.Exit(1) from e
 
 
 @app.command("unadopt")
@@ -367,27 +577,36 @@ def unadopt_camera(
     config = get_config(env_file)
 
     async def _unadopt() -> None:
+        from .client import get_protect_client
+
         async with get_protect_client(config) as client:
-            camera = await client.get_camera(camera_id)
-            if not camera:
-                console.print(f"[red]Camera not found:[/red] {camera_id}")
-                raise typer.Exit(1)
+            await _unadopt_impl(client, camera_id, force)
 
-            if not force:
-                confirm = typer.confirm(f"Are you sure you want to unadopt '{camera.name}'?")
-                if not confirm:
-                    console.print("[yellow]Cancelled[/yellow]")
-                    raise typer.Exit(0)
+    run_async(_unadopt())
 
-            console.print(f"Unadopting camera: [cyan]{camera.name}[/cyan]...")
-            try:
-                await client.unadopt_camera(camera_id)
-                console.print("[green]\u2713[/green] Unadoption initiated successfully")
-            except RuntimeError as e:
-                console.print(f"[red]\u2717[/red] {e}")
-                raise typer.Exit(1) from e
 
-    asyncio.run(_unadopt())
+async def _reboot_impl(client: "UnifiProtectClient", camera_id: str) -> None:
+    """Reboot a camera through the NVR.
+
+    Args:
+        client: Connected Protect client.
+        camera_id: Camera ID to reboot.
+
+    Raises:
+        typer.Exit: If the camera is not found or the reboot fails.
+    """
+    camera = await client.get_camera(camera_id)
+    if not camera:
+        console.print(f"[red]Camera not found:[/red] {camera_id}")
+        raise typer.Exit(1)
+
+    console.print(f"Rebooting camera: [cyan]{camera.name}[/cyan]...")
+    try:
+        await client.reboot_camera(camera_id)
+        console.print("[green]\u2713[/green] Reboot initiated successfully")
+    except RuntimeError as e:
+        console.print(f"[red]\u2717[/red] {e}")
+        raise typer.Exit(1) from e
 
 
 @app.command("reboot")
@@ -411,21 +630,343 @@ def reboot_camera(
     config = get_config(env_file)
 
     async def _reboot() -> None:
+        from .client import get_protect_client
+
+        async with get_protect_client(config) as client:
+            await _reboot_impl(client, camera_id)
+
+    run_async(_reboot())
+
+
+async def _batch_impl(
+    client: "UnifiProtectClient",
+    camera_ids: list[str],
+    action: str,
+    concurrency: int,
+) -> bool:
+    """Adopt, unadopt or reboot many cameras concurrently and print a result table.
+
+    Args:
+        client: Connected Protect client shared by all operations.
+        camera_ids: Camera IDs to act on (duplicates are ignored).
+        action: One of "adopt", "unadopt" or "reboot".
+        concurrency: Maximum number of operations in flight at once.
+
+    Returns:
+        True if the action was initiated for every camera.
+    """
+    batch = {
+        "adopt": client.adopt_cameras,
+        "unadopt": client.unadopt_cameras,
+        "reboot": client.reboot_cameras,
+    }[action]
+
+    unique_ids = list(dict.fromkeys(camera_ids))
+    console.print(f"Running {action} on {len(unique_ids)} cameras...")
+
+    # Settle cameras that need no request first (bootstrap lookups only)
+    names: dict[str, str] = {}
+    results: dict[str, tuple[bool, str]] = {}
+    for camera_id in unique_ids:
+        camera = await client.get_camera(camera_id)
+        if not camera:
+            results[camera_id] = (False, "[red]\u2717[/red] Camera not found")
+            continue
+        names[camera_id] = camera.name
+        if action == "adopt" and camera.is_adopted:
+            results[camera_id] = (True, "[yellow]Already adopted[/yellow]")
+
+    pending = [camera_id for camera_id in names if camera_id not in results]
+    outcomes = await batch(pending, concurrency=concurrency)
+    for camera_id, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            results[camera_id] = (False, f"[red]\u2717[/red] {outcome}")
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[camera_id] = (True, "[green]\u2713[/green] Initiated")
+
+    table = Table(title=f"{action.capitalize()} Results")
+    table.add_column("ID", style="dim")
+    table.add_column("Name", style="cyan")
+    table.add_column("Result")
+    for camera_id in unique_ids:
+        table.add_row(camera_id, names.get(camera_id, "N/A"), results[camera_id][1])
+    console.print(table)
+
+    return all(ok for ok, _ in results.values())
+
+
+@app.command("adopt-many")
+def adopt_many(
+    camera_ids: Annotated[
+        list[str],
+        typer.Argument(
+            help="Camera IDs to adopt",
+            autocompletion=complete_protect_camera_ids,
+        ),
+    ],
+    env_file: Annotated[
+        Path | None,
+        typer.Option("--env", "-e", help="Path to .env file"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-n", min=1, help="Maximum adoptions in flight"),
+    ] = 8,
+) -> None:
+    """Adopt several cameras over one UniFi Protect session.
+
+    Logs in once and initiates the adoptions concurrently, skipping
+    cameras that are already adopted.
+    """
+    config = get_config(env_file)
+
+    async def _adopt_many() -> bool:
+        from .client import get_protect_client
+
+        async with get_protect_client(config) as client:
+            return await _batch_impl(client, camera_ids, "adopt", concurrency)
+
+    if not run_async(_adopt_many()):
+        raise typer.Exit(1)
+
+
+@app.command("unadopt-many")
+def unadopt_many(
+    camera_ids: Annotated[
+        list[str],
+        typer.Argument(
+            help="Camera IDs or IP addresses to unadopt",
+            autocompletion=complete_protect_camera_ids,
+        ),
+    ],
+    env_file: Annotated[
+        Path | None,
+        typer.Option("--env", "-e", help="Path to .env file"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-n", min=1, help="Maximum unadoptions in flight"),
+    ] = 8,
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Skip confirmation prompt"),
+    ] = False,
+) -> None:
+    """Unadopt several cameras over one UniFi Protect session.
+
+    Accepts camera IDs or IP addresses. Asks for a single confirmation
+    listing the cameras (unless --force is given), then unadopts them
+    concurrently.
+    """
+    config = get_config(env_file)
+
+    async def _unadopt_many() -> bool:
+        from .client import get_protect_client
+
         async with get_protect_client(config) as client:
-            camera = await client.get_camera(camera_id)
-            if not camera:
-                console.print(f"[red]Camera not found:[/red] {camera_id}")
-                raise typer.Exit(1)
+            # Resolve IDs and IPs first so the prompt names each camera once;
+            # unknown keys are kept and reported as not found
+            resolved: dict[str, str | None] = {}
+            for key in camera_ids:
+                camera = await client.resolve_camera(key)
+                if camera:
+                    resolved.setdefault(camera.id, camera.name)
+                else:
+                    resolved.setdefault(key, None)
+
+            names = [name for name in resolved.values() if name is not None]
+            if names and not force:
+                noun = "camera" if len(names) == 1 else "cameras"
+                confirm = await asyncio.to_thread(
+                    typer.confirm,
+                    f"Are you sure you want to unadopt {len(names)} {noun} ({', '.join(names)})?",
+                )
+                if not confirm:
+                    console.print("[yellow]Cancelled[/yellow]")
+                    raise typer.Exit(0)
+
+            return await _batch_impl(client, list(resolved), "unadopt", concurrency)
+
+    if not run_async(_unadopt_many()):
+        raise typer.Exit(1)
 
-            console.print(f"Rebooting camera: [cyan]{camera.name}[/cyan]...")
-            try:
-                await client.reboot_camera(camera_id)
-                console.print("[green]\u2713[/green] Reboot initiated successfully")
-            except RuntimeError as e:
-                console.print(f"[red]\u2717[/red] {e}")
-                raise typer.Exit(1) from e
 
-    asyncio.run(_reboot())
+@app.command("reboot-many")
+def reboot_many(
+    camera_ids: Annotated[
+        list[str],
+        typer.Argument(
+            help="Camera IDs to reboot",
+            autocompletion=complete_protect_camera_ids,
+        ),
+    ],
+    env_file: Annotated[
+        Path | None,
+        typer.Option("--env", "-e", help="Path to .env file"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-n", min=1, help="Maximum reboots in flight"),
+    ] = 8,
+) -> None:
+    """Reboot several cameras over one UniFi Protect session.
+
+    Logs in once and sends the reboot commands concurrently.
+    """
+    config = get_config(env_file)
+
+    async def _reboot_many() -> bool:
+        from .client import get_protect_client
+
+        async with get_protect_client(config) as client:
+            return await _batch_impl(client, camera_ids, "reboot", concurrency)
+
+    if not run_async(_reboot_many()):
+        raise typer.Exit(1)
+
+
+SHELL_HELP = """Commands:
+  list [--third-party] [--json]   List cameras
+  info <id-or-ip> [--json]        Show camera details
+  adopt <id>                      Adopt a camera
+  unadopt <id> [--force]          Unadopt a camera
+  reboot <id>                     Reboot a camera
+  help                            Show this help
+  exit                            Leave the shell"""
+
+
+async def _shell_dispatch(client: "UnifiProtectClient", args: list[str]) -> None:
+    """Run one shell command line against a connected Protect client.
+
+    Args:
+        client: Connected Protect client shared by the shell session.
+        args: Command name followed by its arguments.
+
+    Raises:
+        typer.Exit: If the command fails.
+    """
+    command, *rest = args
+    flags = {a for a in rest if a.startswith("-")}
+    positional = [a for a in rest if not a.startswith("-")]
+
+    if command == "help":
+        console.print(SHELL_HELP, markup=False)
+    elif command == "list":
+        await _list_impl(
+            client,
+            show_third_party_only=bool(flags & {"--third-party", "-t"}),
+            as_json="--json" in flags,
+        )
+    elif command in ("info", "adopt", "unadopt", "reboot") and len(positional) == 1:
+        camera_id = positional[0]
+        if command == "info":
+            await _info_impl(client, camera_id, as_json="--json" in flags)
+        elif command == "adopt":
+            await _adopt_impl(client, camera_id)
+        elif command == "unadopt":
+            await _unadopt_impl(client, camera_id, force=bool(flags & {"--force", "-f"}))
+        else:
+            await _reboot_impl(client, camera_id)
+    elif command in ("info", "adopt", "unadopt", "reboot"):
+        console.print(f"[red]Usage:[/red] {command} <camera-id>")
+    else:
+        console.print(f"[red]Unknown command:[/red] {command} (type 'help')")
+
+
+def _read_shell_line(prompt: str) -> str:
+    """Read one shell command line from the console.
+
+    asyncio.Runner turns the first Ctrl-C into a task cancellation, which a
+    blocking read never sees, so the default handler is restored while the
+    prompt waits and Ctrl-C raises KeyboardInterrupt straight away.
+
+    Args:
+        prompt: Rich markup prompt shown before the input.
+
+    Returns:
+        The line entered, without its trailing newline.
+
+    Raises:
+        EOFError: If input is closed.
+        KeyboardInterrupt: If Ctrl-C is pressed at the prompt.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return console.input(prompt)
+
+    previous = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        return console.input(prompt)
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+async def _shell_loop(
+    prompt: str,
+    dispatch: Callable[[list[str]], Awaitable[None]],
+) -> None:
+    """Read and dispatch shell command lines until exit or end of input.
+
+    Args:
+        prompt: Prompt name shown before each line.
+        dispatch: Coroutine function run with each parsed command line.
+    """
+    while True:
+        try:
+            # Nothing needs the loop while the shell is idle, so read inline
+            line = _read_shell_line(f"[bold cyan]{prompt}>[/bold cyan] ")
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+
+        try:
+            await dispatch(args)
+        except typer.Exit:
+            # Commands report their own errors; keep the session open
+            continue
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            log_error(f"Shell command failed: {line}: {e}")
+
+
+@app.command("shell")
+def protect_shell(
+    env_file: Annotated[
+        Path | None,
+        typer.Option("--env", "-e", help="Path to .env file"),
+    ] = None,
+) -> None:
+    """Run UniFi Protect commands interactively over one NVR session.
+
+    Logs in once and keeps the connection open while reading list, info,
+    adopt, unadopt and reboot commands, so each command skips the login
+    and TLS handshake that the one-shot commands repeat.
+    """
+    config = get_config(env_file)
+
+    async def _shell() -> None:
+        from .client import get_protect_client
+
+        async with get_protect_client(config) as client:
+            console.print(
+                f"[green]\u2713[/green] Connected to {config.address}. "
+                "Type 'help' for commands, 'exit' to quit."
+            )
+            await _shell_loop("ucam", lambda args: _shell_dispatch(client, args))
+
+    run_async(_shell())
 
 
 @app.command("verify-onvif")
@@ -442,50 +983,61 @@ def verify_onvif(
     """
 
     async def _verify() -> None:
-        console.print(f"\n[bold]Checking camera at {ip_address}:{port}...[/bold]")
+        from .onvif_discovery import (
+            get_onvif_stream_uri,
+            shared_onvif_cameras,
+            verify_onvif_camera,
+        )
 
-        # First check basic connectivity
-        console.print("  Checking network connectivity...", end=" ")
-        is_reachable = await check_camera_connectivity(ip_address, port)
-        if is_reachable:
-            console.print("[green]\u2713[/green]")
-        else:
-            console.print("[red]\u2717[/red] Camera not reachable")
-            raise typer.Exit(1)
+        console.print(f"\n[bold]Checking camera at {ip_address}:{port}...[/bold]")
 
-        # Verify ONVIF
-        console.print("  Verifying ONVIF connection...", end=" ")
         config = OnvifCameraConfig(
             ip_address=ip_address,
             username=username,
             password=password,
             port=port,
         )
-        info = await verify_onvif_camera(config)
+
+        # Verify ONVIF, fetching device info and stream URI concurrently over
+        # one camera connection. Opening it runs the reachability preflight
+        # once, so an unreachable camera is reported as an error here.
+        console.print("  Verifying ONVIF connection...", end=" ")
+        async with shared_onvif_cameras():
+            info, stream_uri = await asyncio.gather(
+                verify_onvif_camera(config),
+                get_onvif_stream_uri(config),
+                return_exceptions=True,
+            )
+
+        # An unexpected error in either call is reported, not raised
+        if isinstance(stream_uri, BaseException):
+            log_debug(f"ONVIF stream URI lookup failed: {stream_uri!r}")
+            stream_uri = None
+        if isinstance(info, BaseException):
+            info = OnvifCameraInfo(is_accessible=False, error=str(info) or type(info).__name__)
 
         if info.is_accessible:
-            console.print("[green]\u2713[/green]")
-            console.print("\n[bold cyan]Camera Information:[/bold cyan]")
-            console.print(f"  [bold]Manufacturer:[/bold] {info.manufacturer}")
-            console.print(f"  [bold]Model:[/bold] {info.model}")
-            console.print(f"  [bold]Firmware:[/bold] {info.firmware_version}")
-            console.print(f"  [bold]Serial:[/bold] {info.serial_number}")
-            console.print(f"  [bold]Hardware ID:[/bold] {info.hardware_id}")
-
-            # Try to get stream URI
-            console.print("\n  Getting RTSP stream URI...", end=" ")
-            stream_uri = await get_onvif_stream_uri(config)
+            lines = [
+                "[green]\u2713[/green]",
+                "\n[bold cyan]Camera Information:[/bold cyan]",
+                f"  [bold]Manufacturer:[/bold] {info.manufacturer}",
+                f"  [bold]Model:[/bold] {info.model}",
+                f"  [bold]Firmware:[/bold] {info.firmware_version}",
+                f"  [bold]Serial:[/bold] {info.serial_number}",
+                f"  [bold]Hardware ID:[/bold] {info.hardware_id}",
+            ]
             if stream_uri:
-                console.print("[green]\u2713[/green]")
-                console.print(f"  [bold]Stream URI:[/bold] {stream_uri}")
+                lines.append("\n  Getting RTSP stream URI... [green]\u2713[/green]")
+                lines.append(f"  [bold]Stream URI:[/bold] {stream_uri}")
             else:
-                console.print("[yellow]N/A[/yellow]")
+                lines.append("\n  Getting RTSP stream URI... [yellow]N/A[/yellow]")
+            console.print("\n".join(lines))
         else:
             console.print("[red]\u2717[/red]")
             console.print(f"  [red]Error:[/red] {info.error}")
             raise typer.Exit(1)
 
-    asyncio.run(_verify())
+    run_async(_verify())
 
 
 @app.command("find")
@@ -495,6 +1047,10 @@ def find_camera(
         Path | None,
         typer.Option("--env", "-e", help="Path to .env file"),
     ] = None,
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output camera as JSON (null if not found)"),
+    ] = False,
 ) -> None:
     """Find a camera by IP address in UniFi Protect.
 
@@ -504,32 +1060,39 @@ def find_camera(
     config = get_config(env_file)
 
     async def _find() -> None:
+        from .client import get_protect_client
+
         async with get_protect_client(config) as client:
             camera = await client.get_camera_by_ip(ip_address)
 
-            if camera:
-                console.print(f"\n[green]\u2713[/green] Camera found at {ip_address}:")
-                console.print(f"  [bold]Name:[/bold] {camera.name}")
-                console.print(f"  [bold]ID:[/bold] {camera.id}")
-                console.print(f"  [bold]Type:[/bold] {camera.type}")
-                console.print(f"  [bold]Adopted:[/bold] {'Yes' if camera.is_adopted else 'No'}")
+            if as_json:
+                _write_json(camera.model_dump_json() if camera else "null")
+            elif camera:
+                console.print(
+                    f"\n[green]\u2713[/green] Camera found at {ip_address}:\n"
+                    f"  [bold]Name:[/bold] {camera.name}\n"
+                    f"  [bold]ID:[/bold] {camera.id}\n"
+                    f"  [bold]Type:[/bold] {camera.type}\n"
+                    f"  [bold]Adopted:[/bold] {'Yes' if camera.is_adopted else 'No'}"
+                )
             else:
-                console.print(f"\n[yellow]![/yellow] No camera found at {ip_address}")
-                console.print("\n[bold]Suggestions:[/bold]")
                 console.print(
-                    "  1. Ensure 'Discover Third-Party Cameras' is enabled in Protect settings"
+                    f"\n[yellow]![/yellow] No camera found at {ip_address}\n"
+                    "\n[bold]Suggestions:[/bold]\n"
+                    "  1. Ensure 'Discover Third-Party Cameras' is enabled in Protect settings\n"
+                    "  2. Verify the camera has ONVIF enabled\n"
+                    "  3. Check the camera is on the same network as the NVR\n"
+                    "  4. Use 'verify-onvif' command to test ONVIF connectivity"
                 )
-                console.print("  2. Verify the camera has ONVIF enabled")
-                console.print("  3. Check the camera is on the same network as the NVR")
-                console.print("  4. Use 'verify-onvif' command to test ONVIF connectivity")
 
-    asyncio.run(_find())
+    run_async(_find())
 
 
 # =============================================================================
 # ONVIF Camera Management Commands
 # =============================================================================
 
+
 onvif_app = typer.Typer(
     name="onvif",
     help="ONVIF camera management commands for direct camera control.",
@@ -539,9 +1102,13 @@ onvif_app = typer.Typer(
 app.add_typer(onvif_app, name="onvif")
 
 
+@lru_cache(maxsize=1)
 def get_onvif_config_from_env() -> OnvifCameraConfig:
     """Get ONVIF configuration from environment variables.
 
+    The result is cached for the life of the process; call
+    `get_onvif_config_from_env.cache_clear()` after changing ONVIF_* variables.
+
     Returns:
         OnvifCameraConfig from ONVIF_* environment variables.
 
@@ -553,15 +1120,15 @@ def get_onvif_config_from_env() -> OnvifCameraConfig:
     password = os.getenv("ONVIF_PASSWORD")
     port = int(os.getenv("ONVIF_PORT", "80"))
 
-    if not all([ip, user, password]):
+    if not (ip and user and password):
         raise ValueError(
             "Missing ONVIF environment variables. Set ONVIF_IP, ONVIF_USER, ONVIF_PASSWORD"
         )
 
     return OnvifCameraConfig(
-        ip_address=ip,  # type: ignore[arg-type]
-        username=user,  # type: ignore[arg-type]
-        password=password,  # type: ignore[arg-type]
+        ip_address=ip,
+        username=user,
+        password=password,
         port=port,
     )
 
@@ -634,12 +1201,12 @@ def get_onvif_config(
 
     # Try camera name from config.yaml
     if camera_name:
-        config = get_camera_by_name(camera_name)
-        if config:
-            return config
+        match = get_camera_by_name(camera_name)
+        if match:
+            return match
         raise typer.BadParameter(
             f"Camera '{camera_name}' not found in config.yaml. "
-            f"Available: {', '.join(list_camera_names())}"
+            f"Available: {', '.join(c.name for c in load_cameras_config() if c.name)}"
         )
 
     # Try environment
@@ -655,8 +1222,61 @@ def get_onvif_config(
     )
 
 
+def resolve_onvif_config(
+    ip: str | None,
+    user: str | None,
+    password: str | None,
+    port: int,
+    camera_name: str | None = None,
+) -> OnvifCameraConfig:
+    """Resolve command options to an ONVIF config, exiting on failure.
+
+    Wraps get_onvif_config() with the error reporting shared by every
+    command that connects to a camera directly.
+
+    Args:
+        ip: Camera IP address.
+        user: Camera username.
+        password: Camera password.
+        port: Camera port.
+        camera_name: Camera name from config.yaml.
+
+    Returns:
+        OnvifCameraConfig with connection settings.
+
+    Raises:
+        typer.Exit: If no valid configuration source is found.
+    """
+    try:
+        return get_onvif_config(ip, user, password, port, camera_name)
+    except (ValueError, typer.BadParameter) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+# Connection options shared by the `onvif` subcommands
+OnvifCameraOpt = Annotated[
+    str | None,
+    typer.Option(
+        "--camera",
+        "-c",
+        help="Camera name from config.yaml",
+        autocompletion=complete_camera_names,
+    ),
+]
+OnvifIpOpt = Annotated[str | None, typer.Option("--ip", help="Camera IP address")]
+OnvifUserOpt = Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")]
+OnvifPassOpt = Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")]
+OnvifPortOpt = Annotated[int, typer.Option("--port", help="ONVIF port")]
+
+
 @onvif_app.command("list")
-def onvif_list() -> None:
+def onvif_list(
+    verify: Annotated[
+        bool,
+        typer.Option("--verify", help="Check ONVIF access to every camera concurrently"),
+    ] = False,
+) -> None:
     """List all cameras from config.yaml.
 
     Displays a table of all cameras defined in the configuration file.
@@ -683,242 +1303,497 @@ def onvif_list() -> None:
     table.add_column("Address", style="yellow")
     table.add_column("Port", style="dim")
 
-    for cam in cameras:
-        table.add_row(
+    statuses: list[str] = []
+    if verify:
+        from .onvif_discovery import verify_many
+
+        table.add_column("ONVIF")
+        console.print(f"Verifying {len(cameras)} cameras...")
+        results = run_async(verify_many(cameras))
+        statuses = [
+            f"[green]\u2713[/green] {r.manufacturer} {r.model}"
+            if r.is_accessible
+            else f"[red]\u2717[/red] {r.error}"
+            for r in results
+        ]
+
+    for i, cam in enumerate(cameras):
+        row = [
             cam.name or "N/A",
             cam.vendor or "N/A",
             cam.model or "N/A",
             cam.device_type or "N/A",
             cam.ip_address,
             str(cam.port),
-        )
+        ]
+        if statuses:
+            row.append(statuses[i])
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"\n[bold]Total:[/bold] {len(cameras)} cameras")
     console.print("\n[dim]Use: ucam onvif info --camera NAME[/dim]")
 
 
-@onvif_app.command("info")
-def onvif_info(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
-) -> None:
-    """Get comprehensive ONVIF camera information.
+async def _onvif_info_impl(cam: "OnvifCameraManager") -> None:
+    """Print system information, capabilities, profiles and stream URIs.
 
-    Displays system information, capabilities, video profiles, and
-    stream URIs from the specified camera.
+    Args:
+        cam: Connected ONVIF camera manager.
     """
+    # Issue the independent SOAP requests concurrently and print each
+    # section as soon as its own response arrives
+    sys_task = asyncio.create_task(cam.get_system_info())
+    caps_task = asyncio.create_task(cam.get_capabilities())
+    profiles_task = asyncio.create_task(cam.get_profiles())
+    streams_task = asyncio.create_task(cam.get_all_stream_uris())
+    snapshot_task = asyncio.create_task(cam.get_snapshot_uri())
+    tasks = (sys_task, caps_task, profiles_task, streams_task, snapshot_task)
+
     try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+        # System Info
+        sys_info = await sys_task
+        console.print(
+            Panel(
+                _info_grid(
+                    ("Manufacturer", sys_info.manufacturer),
+                    ("Model", sys_info.model),
+                    ("Firmware", sys_info.firmware_version),
+                    ("Serial", sys_info.serial_number),
+                    ("Hardware ID", sys_info.hardware_id),
+                    ("System Time", sys_info.system_date_time or None),
+                ),
+                title="[cyan]System Information[/cyan]",
+                expand=False,
+            )
+        )
 
-    async def _info() -> None:
-        console.print(f"\n[bold]Connecting to {config.ip_address}:{config.port}...[/bold]")
+        # Capabilities
+        caps = await caps_task
+        cap_items = []
+        if caps.has_ptz:
+            cap_items.append("[green]\u2713[/green] PTZ")
+        else:
+            cap_items.append("[dim]\u2717 PTZ[/dim]")
+        if caps.has_audio:
+            cap_items.append("[green]\u2713[/green] Audio")
+        else:
+            cap_items.append("[dim]\u2717 Audio[/dim]")
+        if caps.has_events:
+            cap_items.append("[green]\u2713[/green] Events")
+        else:
+            cap_items.append("[dim]\u2717 Events[/dim]")
+        if caps.has_analytics:
+            cap_items.append("[green]\u2713[/green] Analytics")
+        else:
+            cap_items.append("[dim]\u2717 Analytics[/dim]")
+
+        console.print(
+            Panel(
+                _info_grid(
+                    ("Features", "  ".join(cap_items)),
+                    ("Encodings", ", ".join(caps.supported_encodings) or "N/A"),
+                    ("Profiles", caps.max_profiles),
+                ),
+                title="[cyan]Capabilities[/cyan]",
+                expand=False,
+            )
+        )
 
-        async with OnvifCamera(config) as cam:
-            # System Info
-            sys_info = await cam.get_system_info()
-            console.print(
-                Panel(
-                    f"[bold]Manufacturer:[/bold] {sys_info.manufacturer}\n"
-                    f"[bold]Model:[/bold] {sys_info.model}\n"
-                    f"[bold]Firmware:[/bold] {sys_info.firmware_version}\n"
-                    f"[bold]Serial:[/bold] {sys_info.serial_number}\n"
-                    f"[bold]Hardware ID:[/bold] {sys_info.hardware_id}"
-                    + (
-                        f"\n[bold]System Time:[/bold] {sys_info.system_date_time}"
-                        if sys_info.system_date_time
-                        else ""
-                    ),
-                    title="[cyan]System Information[/cyan]",
-                    expand=False,
+        # Video Profiles
+        profiles = await profiles_task
+        if profiles:
+            table = Table(title="Video Profiles", show_header=True)
+            table.add_column("Token", style="cyan")
+            table.add_column("Name")
+            table.add_column("Resolution")
+            table.add_column("Encoding")
+            table.add_column("FPS")
+            table.add_column("Bitrate")
+
+            for p in profiles:
+                table.add_row(
+                    p.token,
+                    p.name,
+                    f"{p.resolution_width}x{p.resolution_height}",
+                    p.encoding,
+                    str(int(p.frame_rate)),
+                    f"{p.bitrate} kbps" if p.bitrate else "N/A",
                 )
+            console.print(table)
+
+        # Stream URIs
+        streams = await streams_task
+        if streams:
+            console.print("\n[bold cyan]Stream URIs:[/bold cyan]")
+            for stream in streams:
+                console.print(f"  [{stream.profile_token}] {stream.uri}")
+
+        # Snapshot URI
+        snapshot = await snapshot_task
+        if snapshot:
+            console.print(f"\n[bold cyan]Snapshot URI:[/bold cyan] {snapshot}")
+    finally:
+        # Don't leave requests running if rendering or a request failed, and
+        # wait for them so their errors are retrieved before the camera closes
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _onvif_streams_impl(cam: "OnvifCameraManager") -> None:
+    """Print a table of RTSP stream URIs per video profile.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+    """
+    profiles, streams = await asyncio.gather(
+        cam.get_profiles(),
+        cam.get_all_stream_uris(),
+    )
+
+    table = Table(title=f"RTSP Streams - {cam.config.ip_address}")
+    table.add_column("Profile", style="cyan")
+    table.add_column("Resolution", style="green")
+    table.add_column("Encoding")
+    table.add_column("Stream URI", style="yellow")
+
+    # Precompute the (resolution, encoding) cells once per profile token
+    profile_cells = {
+        p.token: (f"{p.resolution_width}x{p.resolution_height}", p.encoding) for p in profiles
+    }
+    missing = ("N/A", "N/A")
+
+    for stream in streams:
+        resolution, encoding = profile_cells.get(stream.profile_token, missing)
+        table.add_row(stream.profile_token, resolution, encoding, stream.uri)
+
+    console.print(table)
+
+
+async def _onvif_profiles_impl(cam: "OnvifCameraManager") -> None:
+    """Print one panel per video profile.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+    """
+    profiles = await cam.get_profiles()
+
+    for p in profiles:
+        console.print(
+            Panel(
+                _info_grid(
+                    ("Resolution", f"{p.resolution_width}x{p.resolution_height}"),
+                    ("Encoding", p.encoding),
+                    ("Frame Rate", f"{p.frame_rate} fps"),
+                    ("Bitrate", f"{p.bitrate} kbps" if p.bitrate else None),
+                    ("Quality", p.quality or None),
+                ),
+                title=f"[cyan]{p.name}[/cyan] ({p.token})",
+                expand=False,
             )
+        )
 
-            # Capabilities
-            caps = await cam.get_capabilities()
-            cap_items = []
-            if caps.has_ptz:
-                cap_items.append("[green]\u2713[/green] PTZ")
-            else:
-                cap_items.append("[dim]\u2717 PTZ[/dim]")
-            if caps.has_audio:
-                cap_items.append("[green]\u2713[/green] Audio")
-            else:
-                cap_items.append("[dim]\u2717 Audio[/dim]")
-            if caps.has_events:
-                cap_items.append("[green]\u2713[/green] Events")
-            else:
-                cap_items.append("[dim]\u2717 Events[/dim]")
-            if caps.has_analytics:
-                cap_items.append("[green]\u2713[/green] Analytics")
-            else:
-                cap_items.append("[dim]\u2717 Analytics[/dim]")
 
-            console.print(
-                Panel(
-                    "  ".join(cap_items)
-                    + f"\n[bold]Encodings:[/bold] {', '.join(caps.supported_encodings) or 'N/A'}"
-                    f"\n[bold]Profiles:[/bold] {caps.max_profiles}",
-                    title="[cyan]Capabilities[/cyan]",
-                    expand=False,
-                )
+async def _onvif_image_impl(
+    cam: "OnvifCameraManager",
+    requested: list[tuple[str, float]],
+) -> None:
+    """Apply image settings, or print the current ones if none are given.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+        requested: (setting name, value) pairs to apply.
+    """
+    # Apply all requested values concurrently
+    results = await asyncio.gather(
+        *(cam.set_image_setting(name, value) for name, value in requested)
+    )
+
+    settings_changed = False
+    for (name, value), ok in zip(requested, results, strict=True):
+        if ok:
+            console.print(f"[green]\u2713[/green] {name.capitalize()} set to {value}")
+            settings_changed = True
+        else:
+            console.print(f"[yellow]![/yellow] Could not set {name}")
+
+    # Show current settings
+    if settings_changed:
+        return
+
+    settings = await cam.get_image_settings()
+    if not settings:
+        console.print("[yellow]Image settings not available for this camera[/yellow]")
+        return
+
+    wdr_str = (
+        "Enabled"
+        if settings.wide_dynamic_range
+        else "Disabled"
+        if settings.wide_dynamic_range is not None
+        else "N/A"
+    )
+    blc_str = (
+        "Enabled"
+        if settings.backlight_compensation
+        else "Disabled"
+        if settings.backlight_compensation is not None
+        else "N/A"
+    )
+    console.print(
+        Panel(
+            _info_grid(
+                ("Brightness", settings.brightness or "N/A"),
+                ("Contrast", settings.contrast or "N/A"),
+                ("Saturation", settings.saturation or "N/A"),
+                ("Sharpness", settings.sharpness or "N/A"),
+                ("IR Cut Filter", settings.ir_cut_filter or "N/A"),
+                ("WDR", wdr_str),
+                ("Backlight Comp", blc_str),
+            ),
+            title="[cyan]Image Settings[/cyan]",
+            expand=False,
+        )
+    )
+
+
+async def _onvif_ptz_impl(
+    cam: "OnvifCameraManager",
+    move: str | None = None,
+    speed: float = 0.5,
+    stop: bool = False,
+    home: bool = False,
+    preset: str | None = None,
+    list_presets: bool = False,
+) -> None:
+    """Print PTZ status and run at most one PTZ action.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+        move: Direction to move continuously, if any.
+        speed: Movement speed (0.0-1.0).
+        stop: Stop PTZ movement.
+        home: Move to the home position.
+        preset: Preset token to move to, if any.
+        list_presets: List presets instead of moving.
+    """
+    if not await cam.has_ptz():
+        console.print("[yellow]This camera does not support PTZ[/yellow]")
+        return
+
+    # Get current status, fetching presets alongside when listing them
+    if list_presets:
+        status, presets = await asyncio.gather(
+            cam.get_ptz_status(),
+            cam.get_ptz_presets(),
+        )
+    else:
+        status = await cam.get_ptz_status()
+    if status:
+        console.print(
+            Panel(
+                _info_grid(
+                    ("Pan", f"{status.pan:.3f}"),
+                    ("Tilt", f"{status.tilt:.3f}"),
+                    ("Zoom", f"{status.zoom:.3f}"),
+                    ("Moving", "Yes" if status.moving else "No"),
+                ),
+                title="[cyan]PTZ Status[/cyan]",
+                expand=False,
             )
+        )
 
-            # Video Profiles
-            profiles = await cam.get_profiles()
-            if profiles:
-                table = Table(title="Video Profiles", show_header=True)
-                table.add_column("Token", style="cyan")
-                table.add_column("Name")
-                table.add_column("Resolution")
-                table.add_column("Encoding")
-                table.add_column("FPS")
-                table.add_column("Bitrate")
-
-                for p in profiles:
-                    table.add_row(
-                        p.token,
-                        p.name,
-                        f"{p.resolution_width}x{p.resolution_height}",
-                        p.encoding,
-                        str(int(p.frame_rate)),
-                        f"{p.bitrate} kbps" if p.bitrate else "N/A",
-                    )
-                console.print(table)
+    # List presets
+    if list_presets:
+        if presets:
+            table = Table(title="PTZ Presets")
+            table.add_column("Token", style="cyan")
+            table.add_column("Name")
+            for p in presets:
+                table.add_row(p.token, p.name)
+            console.print(table)
+        else:
+            console.print("[dim]No presets configured[/dim]")
+        return
 
-            # Stream URIs
-            streams = await cam.get_all_stream_uris()
-            if streams:
-                console.print("\n[bold cyan]Stream URIs:[/bold cyan]")
-                for stream in streams:
-                    console.print(f"  [{stream.profile_token}] {stream.uri}")
+    # Stop movement
+    if stop:
+        if await cam.ptz_stop():
+            console.print("[green]\u2713[/green] PTZ stopped")
+        else:
+            console.print("[red]\u2717[/red] Failed to stop PTZ")
+        return
 
-            # Snapshot URI
-            snapshot = await cam.get_snapshot_uri()
-            if snapshot:
-                console.print(f"\n[bold cyan]Snapshot URI:[/bold cyan] {snapshot}")
+    # Go home
+    if home:
+        if await cam.ptz_home():
+            console.print("[green]\u2713[/green] Moving to home position")
+        else:
+            console.print("[red]\u2717[/red] Failed to move to home")
+        return
 
-    asyncio.run(_info())
+    # Go to preset
+    if preset:
+        if await cam.ptz_goto_preset(preset):
+            console.print(f"[green]\u2713[/green] Moving to preset: {preset}")
+        else:
+            console.print(f"[red]\u2717[/red] Failed to move to preset: {preset}")
+        return
 
+    # Move in direction
+    if move:
+        direction = _PTZ_DIR_MAP.get(move.lower())
+        if not direction:
+            console.print(f"[red]Invalid direction:[/red] {move}")
+            console.print(f"Valid: {', '.join(_PTZ_DIR_MAP)}")
+            return
+
+        if await cam.ptz_move(direction, speed):
+            console.print(f"[green]\u2713[/green] Moving {move} at speed {speed}")
+            console.print("[dim]Use --stop to stop movement[/dim]")
+        else:
+            console.print(f"[red]\u2717[/red] Failed to move {move}")
 
-@onvif_app.command("streams")
-def onvif_streams(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+
+async def _onvif_services_impl(cam: "OnvifCameraManager") -> None:
+    """Print a table of the ONVIF services the camera exposes.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+    """
+    services = await cam.get_services()
+
+    if services:
+        table = Table(title=f"ONVIF Services - {cam.config.ip_address}")
+        table.add_column("Service", style="cyan")
+        table.add_column("Version", style="green")
+        table.add_column("URL", style="dim")
+
+        for s in services:
+            # Extract service name from namespace
+            name = s.namespace.split("/")[-1] if s.namespace else "Unknown"
+            table.add_row(name, s.version, s.xaddr)
+
+        console.print(table)
+    else:
+        console.print("[yellow]Could not retrieve services[/yellow]")
+
+
+async def _onvif_reboot_impl(cam: "OnvifCameraManager") -> None:
+    """Send a reboot command to the camera.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+
+    Raises:
+        typer.Exit: If the reboot request fails.
+    """
+    if await cam.reboot():
+        console.print(f"[green]\u2713[/green] Reboot initiated for {cam.config.ip_address}")
+    else:
+        console.print("[red]\u2717[/red] Failed to reboot camera")
+        raise typer.Exit(1)
+
+
+# Scopes defined by the ONVIF core spec, shown grouped by category
+_ONVIF_SCOPE_PREFIX = "onvif://www.onvif.org/"
+
+
+async def _onvif_scopes_impl(cam: "OnvifCameraManager") -> None:
+    """Print the camera's ONVIF scope URIs as a tree.
+
+    Args:
+        cam: Connected ONVIF camera manager.
+    """
+    scopes = await cam.get_scopes()
+
+    tree = Tree(f"[bold cyan]ONVIF Scopes - {cam.config.ip_address}[/bold cyan]")
+    categories: dict[str, Tree] = {}
+    # Drop duplicate scopes and nest standard ones under their category
+    for scope in sorted(set(scopes)):
+        category, sep, value = scope.removeprefix(_ONVIF_SCOPE_PREFIX).partition("/")
+        if scope.startswith(_ONVIF_SCOPE_PREFIX) and sep:
+            if category not in categories:
+                categories[category] = tree.add(f"[bold]{category}[/bold]")
+            categories[category].add(value)
+        else:
+            tree.add(scope)
+
+    console.print(tree)
+
+
+@onvif_app.command("info")
+def onvif_info(
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
+) -> None:
+    """Get comprehensive ONVIF camera information.
+
+    Displays system information, capabilities, video profiles, and
+    stream URIs from the specified camera.
+    """
+    config = resolve_onvif_config(ip, user, password, port, camera)
+
+    async def _info() -> None:
+        from .onvif_manager import OnvifCamera
+
+        console.print(f"\n[bold]Connecting to {config.ip_address}:{config.port}...[/bold]")
+
+        async with OnvifCamera(config) as cam:
+            await _onvif_info_impl(cam)
+
+    run_async(_info())
+
+
+@onvif_app.command("streams")
+def onvif_streams(
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
 ) -> None:
     """List all available RTSP stream URIs.
 
     Displays stream URIs for each video profile on the camera.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _streams() -> None:
-        async with OnvifCamera(config) as cam:
-            profiles = await cam.get_profiles()
-            streams = await cam.get_all_stream_uris()
-
-            table = Table(title=f"RTSP Streams - {config.ip_address}")
-            table.add_column("Profile", style="cyan")
-            table.add_column("Resolution", style="green")
-            table.add_column("Encoding")
-            table.add_column("Stream URI", style="yellow")
-
-            profile_map = {p.token: p for p in profiles}
+        from .onvif_manager import OnvifCamera
 
-            for stream in streams:
-                profile = profile_map.get(stream.profile_token)
-                table.add_row(
-                    stream.profile_token,
-                    f"{profile.resolution_width}x{profile.resolution_height}" if profile else "N/A",
-                    profile.encoding if profile else "N/A",
-                    stream.uri,
-                )
-
-            console.print(table)
+        async with OnvifCamera(config) as cam:
+            await _onvif_streams_impl(cam)
 
-    asyncio.run(_streams())
+    run_async(_streams())
 
 
 @onvif_app.command("profiles")
 def onvif_profiles(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
 ) -> None:
     """List video profiles with detailed configuration.
 
     Displays detailed information about each video profile including
     resolution, encoding, frame rate, and quality settings.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _profiles() -> None:
-        async with OnvifCamera(config) as cam:
-            profiles = await cam.get_profiles()
-
-            for p in profiles:
-                content = (
-                    f"[bold]Resolution:[/bold] {p.resolution_width}x{p.resolution_height}\n"
-                    f"[bold]Encoding:[/bold] {p.encoding}\n"
-                    f"[bold]Frame Rate:[/bold] {p.frame_rate} fps"
-                )
-                if p.bitrate:
-                    content += f"\n[bold]Bitrate:[/bold] {p.bitrate} kbps"
-                if p.quality:
-                    content += f"\n[bold]Quality:[/bold] {p.quality}"
+        from .onvif_manager import OnvifCamera
 
-                console.print(
-                    Panel(
-                        content,
-                        title=f"[cyan]{p.name}[/cyan] ({p.token})",
-                        expand=False,
-                    )
-                )
+        async with OnvifCamera(config) as cam:
+            await _onvif_profiles_impl(cam)
 
-    asyncio.run(_profiles())
+    run_async(_profiles())
 
 
 @onvif_app.command("image")
@@ -931,10 +1806,10 @@ def onvif_image(
             autocompletion=complete_camera_names,
         ),
     ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
     brightness: Annotated[
         float | None, typer.Option("--brightness", "-b", help="Set brightness (0-100)")
     ] = None,
@@ -953,96 +1828,34 @@ def onvif_image(
     Without any setting options, displays current image settings.
     With setting options, modifies the specified settings.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
+    requested = [
+        (name, value)
+        for name, value in (
+            ("brightness", brightness),
+            ("contrast", contrast),
+            ("saturation", saturation),
+            ("sharpness", sharpness),
+        )
+        if value is not None
+    ]
 
     async def _image() -> None:
-        async with OnvifCamera(config) as cam:
-            # Set values if provided
-            settings_changed = False
-            if brightness is not None:
-                if await cam.set_image_setting("brightness", brightness):
-                    console.print(f"[green]\u2713[/green] Brightness set to {brightness}")
-                    settings_changed = True
-                else:
-                    console.print("[yellow]![/yellow] Could not set brightness")
+        from .onvif_manager import OnvifCamera
 
-            if contrast is not None:
-                if await cam.set_image_setting("contrast", contrast):
-                    console.print(f"[green]\u2713[/green] Contrast set to {contrast}")
-                    settings_changed = True
-                else:
-                    console.print("[yellow]![/yellow] Could not set contrast")
-
-            if saturation is not None:
-                if await cam.set_image_setting("saturation", saturation):
-                    console.print(f"[green]\u2713[/green] Saturation set to {saturation}")
-                    settings_changed = True
-                else:
-                    console.print("[yellow]![/yellow] Could not set saturation")
-
-            if sharpness is not None:
-                if await cam.set_image_setting("sharpness", sharpness):
-                    console.print(f"[green]\u2713[/green] Sharpness set to {sharpness}")
-                    settings_changed = True
-                else:
-                    console.print("[yellow]![/yellow] Could not set sharpness")
-
-            # Show current settings
-            if not settings_changed:
-                settings = await cam.get_image_settings()
-                if settings:
-                    wdr_str = (
-                        "Enabled"
-                        if settings.wide_dynamic_range
-                        else "Disabled"
-                        if settings.wide_dynamic_range is not None
-                        else "N/A"
-                    )
-                    blc_str = (
-                        "Enabled"
-                        if settings.backlight_compensation
-                        else "Disabled"
-                        if settings.backlight_compensation is not None
-                        else "N/A"
-                    )
-                    console.print(
-                        Panel(
-                            f"[bold]Brightness:[/bold] {settings.brightness or 'N/A'}\n"
-                            f"[bold]Contrast:[/bold] {settings.contrast or 'N/A'}\n"
-                            f"[bold]Saturation:[/bold] {settings.saturation or 'N/A'}\n"
-                            f"[bold]Sharpness:[/bold] {settings.sharpness or 'N/A'}\n"
-                            f"[bold]IR Cut Filter:[/bold] {settings.ir_cut_filter or 'N/A'}\n"
-                            f"[bold]WDR:[/bold] {wdr_str}\n"
-                            f"[bold]Backlight Comp:[/bold] {blc_str}",
-                            title="[cyan]Image Settings[/cyan]",
-                            expand=False,
-                        )
-                    )
-                else:
-                    console.print("[yellow]Image settings not available for this camera[/yellow]")
+        async with OnvifCamera(config) as cam:
+            await _onvif_image_impl(cam, requested)
 
-    asyncio.run(_image())
+    run_async(_image())
 
 
 @onvif_app.command("ptz")
 def onvif_ptz(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
     move: Annotated[
         str | None,
         typer.Option(
@@ -1067,159 +1880,56 @@ def onvif_ptz(
     Without movement options, displays current PTZ status.
     Supports continuous movement, preset positions, and home.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _ptz() -> None:
-        async with OnvifCamera(config) as cam:
-            if not await cam.has_ptz():
-                console.print("[yellow]This camera does not support PTZ[/yellow]")
-                return
-
-            # Get current status
-            status = await cam.get_ptz_status()
-            if status:
-                console.print(
-                    Panel(
-                        f"[bold]Pan:[/bold] {status.pan:.3f}\n"
-                        f"[bold]Tilt:[/bold] {status.tilt:.3f}\n"
-                        f"[bold]Zoom:[/bold] {status.zoom:.3f}\n"
-                        f"[bold]Moving:[/bold] {'Yes' if status.moving else 'No'}",
-                        title="[cyan]PTZ Status[/cyan]",
-                        expand=False,
-                    )
-                )
-
-            # List presets
-            if list_presets:
-                presets = await cam.get_ptz_presets()
-                if presets:
-                    table = Table(title="PTZ Presets")
-                    table.add_column("Token", style="cyan")
-                    table.add_column("Name")
-                    for p in presets:
-                        table.add_row(p.token, p.name)
-                    console.print(table)
-                else:
-                    console.print("[dim]No presets configured[/dim]")
-                return
-
-            # Stop movement
-            if stop:
-                if await cam.ptz_stop():
-                    console.print("[green]\u2713[/green] PTZ stopped")
-                else:
-                    console.print("[red]\u2717[/red] Failed to stop PTZ")
-                return
-
-            # Go home
-            if home:
-                if await cam.ptz_home():
-                    console.print("[green]\u2713[/green] Moving to home position")
-                else:
-                    console.print("[red]\u2717[/red] Failed to move to home")
-                return
-
-            # Go to preset
-            if preset:
-                if await cam.ptz_goto_preset(preset):
-                    console.print(f"[green]\u2713[/green] Moving to preset: {preset}")
-                else:
-                    console.print(f"[red]\u2717[/red] Failed to move to preset: {preset}")
-                return
-
-            # Move in direction
-            if move:
-                direction_map = {
-                    "up": PTZDirection.UP,
-                    "down": PTZDirection.DOWN,
-                    "left": PTZDirection.LEFT,
-                    "right": PTZDirection.RIGHT,
-                    "zoom_in": PTZDirection.ZOOM_IN,
-                    "zoom_out": PTZDirection.ZOOM_OUT,
-                }
-                direction = direction_map.get(move.lower())
-                if not direction:
-                    console.print(f"[red]Invalid direction:[/red] {move}")
-                    console.print("Valid: up, down, left, right, zoom_in, zoom_out")
-                    return
+        from .onvif_manager import OnvifCamera
 
-                if await cam.ptz_move(direction, speed):
-                    console.print(f"[green]\u2713[/green] Moving {move} at speed {speed}")
-                    console.print("[dim]Use --stop to stop movement[/dim]")
-                else:
-                    console.print(f"[red]\u2717[/red] Failed to move {move}")
+        async with OnvifCamera(config) as cam:
+            await _onvif_ptz_impl(
+                cam,
+                move=move,
+                speed=speed,
+                stop=stop,
+                home=home,
+                preset=preset,
+                list_presets=list_presets,
+            )
 
-    asyncio.run(_ptz())
+    run_async(_ptz())
 
 
 @onvif_app.command("services")
 def onvif_services(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
 ) -> None:
     """List available ONVIF services on the camera.
 
     Displays all ONVIF services exposed by the camera including
     their versions and endpoints.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _services() -> None:
-        async with OnvifCamera(config) as cam:
-            services = await cam.get_services()
-
-            if services:
-                table = Table(title=f"ONVIF Services - {config.ip_address}")
-                table.add_column("Service", style="cyan")
-                table.add_column("Version", style="green")
-                table.add_column("URL", style="dim")
+        from .onvif_manager import OnvifCamera
 
-                for s in services:
-                    # Extract service name from namespace
-                    name = s.namespace.split("/")[-1] if s.namespace else "Unknown"
-                    table.add_row(name, s.version, s.xaddr)
-
-                console.print(table)
-            else:
-                console.print("[yellow]Could not retrieve services[/yellow]")
+        async with OnvifCamera(config) as cam:
+            await _onvif_services_impl(cam)
 
-    asyncio.run(_services())
+    run_async(_services())
 
 
 @onvif_app.command("reboot")
 def onvif_reboot(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
     force: Annotated[bool, typer.Option("--force", "-f", help="Skip confirmation")] = False,
 ) -> None:
     """Reboot the ONVIF camera.
@@ -1227,11 +1937,7 @@ def onvif_reboot(
     Sends a reboot command directly to the camera via ONVIF.
     Requires confirmation unless --force is specified.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     if not force:
         confirm = typer.confirm(f"Are you sure you want to reboot {config.ip_address}?")
@@ -1240,54 +1946,150 @@ def onvif_reboot(
             raise typer.Exit(0)
 
     async def _reboot() -> None:
+        from .onvif_manager import OnvifCamera
+
         async with OnvifCamera(config) as cam:
-            if await cam.reboot():
-                console.print(f"[green]\u2713[/green] Reboot initiated for {config.ip_address}")
-            else:
-                console.print("[red]\u2717[/red] Failed to reboot camera")
-                raise typer.Exit(1)
+            await _onvif_reboot_impl(cam)
 
-    asyncio.run(_reboot())
+    run_async(_reboot())
 
 
 @onvif_app.command("scopes")
 def onvif_scopes(
-    camera: Annotated[
-        str | None,
-        typer.Option(
-            "--camera",
-            "-c",
-            help="Camera name from config.yaml",
-            autocompletion=complete_camera_names,
-        ),
-    ] = None,
-    ip: Annotated[str | None, typer.Option("--ip", help="Camera IP address")] = None,
-    user: Annotated[str | None, typer.Option("--user", "-u", help="ONVIF username")] = None,
-    password: Annotated[str | None, typer.Option("--pass", "-p", help="ONVIF password")] = None,
-    port: Annotated[int, typer.Option("--port", help="ONVIF port")] = 80,
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
 ) -> None:
     """List ONVIF device scopes (profile information).
 
     Displays ONVIF scope URIs that describe the device's
     ONVIF profile compliance and capabilities.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _scopes() -> None:
+        from .onvif_manager import OnvifCamera
+
         async with OnvifCamera(config) as cam:
-            scopes = await cam.get_scopes()
+            await _onvif_scopes_impl(cam)
+
+    run_async(_scopes())
+
+
+ONVIF_SHELL_HELP = """Commands:
+  info                            Show camera information
+  streams                         List RTSP stream URIs
+  profiles                        Show video profiles
+  image [NAME=VALUE ...]          Show or set brightness/contrast/saturation/sharpness
+  ptz                             Show PTZ status
+  ptz move <direction> [speed]    Start moving (up, down, left, right, zoom_in, zoom_out)
+  ptz stop | home | presets       Stop, go home or list presets
+  ptz preset <token>              Go to a preset
+  services                        List ONVIF services
+  scopes                          List ONVIF scopes
+  reboot [--force]                Reboot the camera
+  help                            Show this help
+  exit                            Leave the shell"""
+
+# Settings accepted by `image NAME=VALUE` in the ONVIF shell
+_IMAGE_SETTINGS = ("brightness", "contrast", "saturation", "sharpness")
+
+
+async def _onvif_shell_dispatch(cam: "OnvifCameraManager", args: list[str]) -> None:
+    """Run one shell command line against a connected ONVIF camera.
+
+    Args:
+        cam: Connected ONVIF camera manager shared by the shell session.
+        args: Command name followed by its arguments.
+
+    Raises:
+        typer.Exit: If the command fails.
+    """
+    command, *rest = args
+
+    if command == "help":
+        console.print(ONVIF_SHELL_HELP, markup=False)
+    elif command == "info":
+        await _onvif_info_impl(cam)
+    elif command == "streams":
+        await _onvif_streams_impl(cam)
+    elif command == "profiles":
+        await _onvif_profiles_impl(cam)
+    elif command == "services":
+        await _onvif_services_impl(cam)
+    elif command == "scopes":
+        await _onvif_scopes_impl(cam)
+    elif command == "image":
+        requested = []
+        for arg in rest:
+            name, sep, value = arg.partition("=")
+            if not sep or name not in _IMAGE_SETTINGS:
+                console.print("[red]Usage:[/red] image [NAME=VALUE ...]")
+                return
+            requested.append((name, float(value)))
+        await _onvif_image_impl(cam, requested)
+    elif command == "ptz":
+        action, *params = rest or ["status"]
+        if action == "status" and not params:
+            await _onvif_ptz_impl(cam)
+        elif action in ("stop", "home", "presets") and not params:
+            await _onvif_ptz_impl(
+                cam,
+                stop=action == "stop",
+                home=action == "home",
+                list_presets=action == "presets",
+            )
+        elif action == "preset" and len(params) == 1:
+            await _onvif_ptz_impl(cam, preset=params[0])
+        elif action == "move" and len(params) in (1, 2):
+            speed = float(params[1]) if len(params) == 2 else 0.5
+            await _onvif_ptz_impl(cam, move=params[0], speed=speed)
+        else:
+            console.print(
+                "[red]Usage:[/red] ptz [move DIR [SPEED] | stop | home | presets | preset TOKEN]"
+            )
+    elif command == "reboot":
+        if not {"--force", "-f"} & set(rest):
+            confirm = await asyncio.to_thread(
+                typer.confirm, f"Are you sure you want to reboot {cam.config.ip_address}?"
+            )
+            if not confirm:
+                console.print("[yellow]Cancelled[/yellow]")
+                return
+        await _onvif_reboot_impl(cam)
+    else:
+        console.print(f"[red]Unknown command:[/red] {command} (type 'help')")
 
-            tree = Tree(f"[bold cyan]ONVIF Scopes - {config.ip_address}[/bold cyan]")
-            for scope in scopes:
-                tree.add(scope)
 
-            console.print(tree)
+@onvif_app.command("shell")
+def onvif_shell(
+    camera: OnvifCameraOpt = None,
+    ip: OnvifIpOpt = None,
+    user: OnvifUserOpt = None,
+    password: OnvifPassOpt = None,
+    port: OnvifPortOpt = 80,
+) -> None:
+    """Run ONVIF commands interactively over one camera connection.
+
+    Connects once and keeps the ONVIF session open while reading info,
+    streams, image, ptz and other commands, so each command skips the
+    client setup and WSDL loading that the one-shot commands repeat.
+    """
+    config = resolve_onvif_config(ip, user, password, port, camera)
+
+    async def _shell() -> None:
+        from .onvif_manager import OnvifCamera
+
+        async with OnvifCamera(config) as cam:
+            console.print(
+                f"[green]\u2713[/green] Connected to {config.ip_address}:{config.port}. "
+                "Type 'help' for commands, 'exit' to quit."
+            )
+            await _shell_loop("onvif", lambda args: _onvif_shell_dispatch(cam, args))
 
-    asyncio.run(_scopes())
+    run_async(_shell())
 
 
 # =============================================================================
@@ -1337,11 +2139,7 @@ def logs_get(
     Fetches logs from the camera's VAPIX API and displays them
     in a formatted table or raw format.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     # Map log type string to enum
     type_map = {
@@ -1357,6 +2155,8 @@ def logs_get(
         raise typer.Exit(1)
 
     async def _get_logs() -> None:
+        from .axis_logs import get_camera_logs
+
         console.print(f"\n[bold]Fetching {log_type} logs from {config.ip_address}...[/bold]")
 
         try:
@@ -1396,7 +2196,7 @@ def logs_get(
             console.print(f"[red]Error retrieving logs:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_logs())
+    run_axis_async(_get_logs())
 
 
 @logs_app.command("system")
@@ -1422,13 +2222,11 @@ def logs_system(
 
     Shortcut for 'logs get --type system'.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_logs() -> None:
+        from .axis_logs import AxisLogClient
+
         console.print(f"\n[bold]Fetching system logs from {config.ip_address}...[/bold]")
 
         try:
@@ -1465,7 +2263,7 @@ def logs_system(
             console.print(f"[red]Error retrieving logs:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_logs())
+    run_axis_async(_get_logs())
 
 
 @logs_app.command("audit")
@@ -1492,13 +2290,11 @@ def logs_audit(
     Shortcut for 'logs get --type audit'.
     Audit logs track configuration changes and administrative actions.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_logs() -> None:
+        from .axis_logs import AxisLogClient
+
         console.print(f"\n[bold]Fetching audit logs from {config.ip_address}...[/bold]")
 
         try:
@@ -1528,7 +2324,7 @@ def logs_audit(
             console.print(f"[red]Error retrieving logs:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_logs())
+    run_axis_async(_get_logs())
 
 
 @logs_app.command("access")
@@ -1555,13 +2351,11 @@ def logs_access(
     Shortcut for 'logs get --type access'.
     Access logs track HTTP requests to the camera.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_logs() -> None:
+        from .axis_logs import AxisLogClient
+
         console.print(f"\n[bold]Fetching access logs from {config.ip_address}...[/bold]")
 
         try:
@@ -1589,7 +2383,7 @@ def logs_access(
             console.print(f"[red]Error retrieving logs:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_logs())
+    run_axis_async(_get_logs())
 
 
 @logs_app.command("files")
@@ -1612,13 +2406,11 @@ def logs_files(
 
     Shows all log files available in the camera's server report.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _list_files() -> None:
+        from .axis_logs import AxisLogClient
+
         console.print(f"\n[bold]Fetching log files from {config.ip_address}...[/bold]")
 
         try:
@@ -1643,7 +2435,7 @@ def logs_files(
             console.print(f"[red]Error listing files:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_list_files())
+    run_axis_async(_list_files())
 
 
 # =============================================================================
@@ -1730,13 +2522,13 @@ def axis_config(
 
     Requires AXIS admin credentials (axis_username/axis_password in config).
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_config() -> None:
+        import httpx
+
+        from .axis_config import AxisConfigClient
+
         # Suppress status messages when outputting to file
         if not output:
             console.print(f"\n[bold]Fetching configuration from {config.ip_address}...[/bold]")
@@ -1754,7 +2546,7 @@ def axis_config(
                     if output:
                         with open(output, "w") as f:
                             json.dump(group_data, f, indent=2)
-                        console.print(f"[green]✓[/green] Saved to {output}")
+                        console.print(f"[green]\u2713[/green] Saved to {output}")
                         return
 
                     if raw:
@@ -1768,7 +2560,8 @@ def axis_config(
                         table.add_column("Parameter", style="cyan")
                         table.add_column("Value", style="green")
 
-                        for key, value in sorted(flat_params.items()):
+                        for key in sorted(flat_params):
+                            value = flat_params[key]
                             # Truncate long values
                             display_value = value[:60] + "..." if len(value) > 60 else value
                             table.add_row(key, display_value)
@@ -1791,7 +2584,7 @@ def axis_config(
                         if output:
                             with open(output, "w") as f:
                                 json.dump(matches, f, indent=2)
-                            console.print(f"[green]✓[/green] Saved to {output}")
+                            console.print(f"[green]\u2713[/green] Saved to {output}")
                             return
 
                         if raw:
@@ -1801,8 +2594,8 @@ def axis_config(
                             table.add_column("Parameter", style="cyan")
                             table.add_column("Value", style="green")
 
-                            for key, value in sorted(matches.items()):
-                                val_str = str(value)
+                            for key in sorted(matches):
+                                val_str = str(matches[key])
                                 if len(val_str) > 60:
                                     display_value = val_str[:60] + "..."
                                 else:
@@ -1818,7 +2611,7 @@ def axis_config(
                         if output:
                             with open(output, "w") as f:
                                 json.dump(cfg.data, f, indent=2)
-                            console.print(f"[green]✓[/green] Saved to {output}")
+                            console.print(f"[green]\u2713[/green] Saved to {output}")
                             return
 
                         console.print(
@@ -1857,7 +2650,7 @@ def axis_config(
             console.print(f"[red]Error retrieving configuration:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_config())
+    run_axis_async(_get_config())
 
 
 @axis_app.command("param")
@@ -1883,13 +2676,13 @@ def axis_param(
         ucam axis param Brand.ProdFullName --camera Front_Of_House
         ucam axis param Network.Bonjour.FriendlyName -c Intercom
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_param() -> None:
+        import httpx
+
+        from .axis_config import AxisConfigClient
+
         try:
             async with AxisConfigClient(config) as client:
                 value = await client.get_parameter(name)
@@ -1910,7 +2703,7 @@ def axis_param(
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_param())
+    run_axis_async(_get_param())
 
 
 @axis_app.command("groups")
@@ -1933,13 +2726,13 @@ def axis_groups(
 
     Shows all parameter groups and their sizes.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _list_groups() -> None:
+        import httpx
+
+        from .axis_config import AxisConfigClient
+
         console.print(f"\n[bold]Fetching parameter groups from {config.ip_address}...[/bold]")
 
         try:
@@ -1977,7 +2770,7 @@ def axis_groups(
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_list_groups())
+    run_axis_async(_list_groups())
 
 
 @axis_app.command("info")
@@ -2001,13 +2794,13 @@ def axis_info(
     Shows brand, model, firmware, and other device details
     from the VAPIX parameter API.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _get_info() -> None:
+        import httpx
+
+        from .axis_config import AxisConfigClient
+
         console.print(f"\n[bold]Fetching device info from {config.ip_address}...[/bold]")
 
         try:
@@ -2017,13 +2810,15 @@ def axis_info(
                 # v2beta API returns nested JSON, so keys are direct (not dot-notation)
                 console.print(
                     Panel(
-                        f"[bold]Brand:[/bold] {brand_data.get('Brand', 'N/A')}\n"
-                        f"[bold]Product:[/bold] {brand_data.get('ProdFullName', 'N/A')}\n"
-                        f"[bold]Short Name:[/bold] {brand_data.get('ProdShortName', 'N/A')}\n"
-                        f"[bold]Type:[/bold] {brand_data.get('ProdType', 'N/A')}\n"
-                        f"[bold]Number:[/bold] {brand_data.get('ProdNbr', 'N/A')}\n"
-                        f"[bold]Variant:[/bold] {brand_data.get('ProdVariant', 'N/A')}\n"
-                        f"[bold]Web URL:[/bold] {brand_data.get('WebURL', 'N/A')}",
+                        _info_grid(
+                            ("Brand", brand_data.get("Brand", "N/A")),
+                            ("Product", brand_data.get("ProdFullName", "N/A")),
+                            ("Short Name", brand_data.get("ProdShortName", "N/A")),
+                            ("Type", brand_data.get("ProdType", "N/A")),
+                            ("Number", brand_data.get("ProdNbr", "N/A")),
+                            ("Variant", brand_data.get("ProdVariant", "N/A")),
+                            ("Web URL", brand_data.get("WebURL", "N/A")),
+                        ),
                         title=f"[cyan]AXIS Device Info - {config.ip_address}[/cyan]",
                         expand=False,
                     )
@@ -2039,7 +2834,7 @@ def axis_info(
             console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_get_info())
+    run_axis_async(_get_info())
 
 
 @axis_app.command("lldp")
@@ -2065,13 +2860,11 @@ def axis_lldp(
     connected switch ports and network topology data. Useful for
     troubleshooting network connectivity issues.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _lldp() -> None:
+        from .axis_lldp import AxisLLDPClient
+
         console.print(f"\n[bold]Fetching LLDP info from {config.ip_address}...[/bold]")
 
         try:
@@ -2096,12 +2889,14 @@ def axis_lldp(
                 enabled_str = "[green]Enabled[/green]" if status.enabled else "[red]Disabled[/red]"
                 console.print(
                     Panel(
-                        f"[bold]Status:[/bold] {enabled_str}\n"
-                        f"[bold]Transmit Interval:[/bold] {status.transmit_interval}s\n"
-                        f"[bold]Hold Multiplier:[/bold] {status.hold_multiplier}\n"
-                        f"[bold]Chassis ID:[/bold] {status.chassis_id or 'N/A'}\n"
-                        f"[bold]Port ID:[/bold] {status.port_id or 'N/A'}\n"
-                        f"[bold]System Name:[/bold] {status.system_name or 'N/A'}",
+                        _info_grid(
+                            ("Status", enabled_str),
+                            ("Transmit Interval", f"{status.transmit_interval}s"),
+                            ("Hold Multiplier", status.hold_multiplier),
+                            ("Chassis ID", status.chassis_id or "N/A"),
+                            ("Port ID", status.port_id or "N/A"),
+                            ("System Name", status.system_name or "N/A"),
+                        ),
                         title=f"[cyan]LLDP Status - {config.ip_address}[/cyan]",
                         expand=False,
                     )
@@ -2134,7 +2929,7 @@ def axis_lldp(
             log_error(f"LLDP retrieval failed: {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_lldp())
+    run_axis_async(_lldp())
 
 
 @axis_app.command("diagnostics")
@@ -2159,13 +2954,11 @@ def axis_diagnostics(
     configuration. Useful for troubleshooting stream connectivity issues
     such as streams stopping when paired with third-party devices.
     """
-    try:
-        config = get_onvif_config(ip, user, password, port, camera)
-    except (ValueError, typer.BadParameter) as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    config = resolve_onvif_config(ip, user, password, port, camera)
 
     async def _diagnostics() -> None:
+        from .axis_diagnostics import AxisDiagnosticsClient
+
         console.print(f"\n[bold]Fetching diagnostics from {config.ip_address}...[/bold]")
 
         try:
@@ -2192,11 +2985,13 @@ def axis_diagnostics(
                 path_args = "Allowed" if rtsp.allow_path_arguments else "Denied"
                 console.print(
                     Panel(
-                        f"[bold]Status:[/bold] {rtsp_status}\n"
-                        f"[bold]Port:[/bold] {rtsp.port}\n"
-                        f"[bold]Authentication:[/bold] {rtsp.authentication}\n"
-                        f"[bold]Timeout:[/bold] {rtsp.timeout}s\n"
-                        f"[bold]Path Arguments:[/bold] {path_args}",
+                        _info_grid(
+                            ("Status", rtsp_status),
+                            ("Port", rtsp.port),
+                            ("Authentication", rtsp.authentication),
+                            ("Timeout", f"{rtsp.timeout}s"),
+                            ("Path Arguments", path_args),
+                        ),
                         title="[cyan]RTSP Configuration[/cyan]",
                         expand=False,
                     )
@@ -2207,12 +3002,10 @@ def axis_diagnostics(
                 mcast = "[green]Enabled[/green]" if rtp.multicast_enabled else "[dim]Disabled[/dim]"
                 console.print(
                     Panel(
-                        f"[bold]Port Range:[/bold] {rtp.start_port} - {rtp.end_port}\n"
-                        f"[bold]Multicast:[/bold] {mcast}\n"
-                        + (
-                            f"[bold]Multicast Address:[/bold] {rtp.multicast_address}"
-                            if rtp.multicast_address
-                            else ""
+                        _info_grid(
+                            ("Port Range", f"{rtp.start_port} - {rtp.end_port}"),
+                            ("Multicast", mcast),
+                            ("Multicast Address", rtp.multicast_address or None),
                         ),
                         title="[cyan]RTP Configuration[/cyan]",
                         expand=False,
@@ -2248,12 +3041,14 @@ def axis_diagnostics(
                 ipv6 = "[green]Enabled[/green]" if net.ipv6_enabled else "[dim]Disabled[/dim]"
                 console.print(
                     Panel(
-                        f"[bold]Hostname:[/bold] {net.hostname or 'N/A'}\n"
-                        f"[bold]IP Config:[/bold] {dhcp}\n"
-                        f"[bold]IP Address:[/bold] {net.ip_address or 'N/A'}\n"
-                        f"[bold]Gateway:[/bold] {net.gateway or 'N/A'}\n"
-                        f"[bold]MTU:[/bold] {net.mtu}\n"
-                        f"[bold]IPv6:[/bold] {ipv6}",
+                        _info_grid(
+                            ("Hostname", net.hostname or "N/A"),
+                            ("IP Config", dhcp),
+                            ("IP Address", net.ip_address or "N/A"),
+                            ("Gateway", net.gateway or "N/A"),
+                            ("MTU", net.mtu),
+                            ("IPv6", ipv6),
+                        ),
                         title="[cyan]Network Configuration[/cyan]",
                         expand=False,
                     )
@@ -2266,7 +3061,7 @@ def axis_diagnostics(
             log_error(f"Diagnostics retrieval failed: {e}")
             raise typer.Exit(1) from e
 
-    asyncio.run(_diagnostics())
+    run_axis_async(_diagnostics())
 
 
 # =============================================================================
@@ -2276,7 +3071,12 @@ def axis_diagnostics(
 
 def main() -> None:
     """Main entry point for the CLI."""
-    app()
+    try:
+        app()
+    finally:
+        # Close the loop before interpreter shutdown, when the default
+        # executor can no longer start threads
+        _close_runner()
 
 
 if __name__ == "__main__":
@@ -4,16 +4,46 @@ This module provides an async client for interacting with UniFi Protect NVRs,
 supporting camera management operations like listing, adoption, and control.
 """
 
-import contextlib
-from collections.abc import AsyncIterator
+import asyncio
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 
+import aiohttp
 from uiprotect import ProtectApiClient
 from uiprotect.data import Camera, ModelType
 
 from .config import ProtectConfig
+from .logging_config import log_debug
 from .models import CameraInfo, NvrInfo
 
+# Connection pool settings for the Protect API session
+PROTECT_CONNECTIONS_PER_HOST = 8
+PROTECT_KEEPALIVE_TIMEOUT = 60.0
+
+# last_seen is not a field on every uiprotect release; check the schema once
+_HAS_LAST_SEEN = "last_seen" in Camera.model_fields
+
+# Seconds a list_cameras() snapshot is reused before it is rebuilt
+CAMERA_SNAPSHOT_TTL = 2.0
+
+# Errors expected while tearing down a connection that may already be closed
+_DISCONNECT_ERRORS = (aiohttp.ClientError, OSError, RuntimeError)
+
+
+def is_third_party_camera(camera: Camera) -> bool:
+    """Check whether a uiprotect Camera is a third-party (non-UniFi) camera.
+
+    Args:
+        camera: Camera object from uiprotect library.
+
+    Returns:
+        True if the camera type is not a UniFi (UVC) model.
+    """
+    return not (camera.type or "").startswith("UVC")
+
 
 def camera_info_from_protect(camera: Camera) -> CameraInfo:
     """Create CameraInfo from a uiprotect Camera object.
@@ -24,18 +54,19 @@ def camera_info_from_protect(camera: Camera) -> CameraInfo:
     Returns:
         CameraInfo with extracted camera data.
     """
-    camera_type = str(camera.type) if camera.type else "Unknown"
-    is_third_party = not camera_type.startswith("UVC")
+    # type is a plain string; state is a StrEnum, so read its value directly
+    camera_type = camera.type or "Unknown"
+    host = camera.host
 
     return CameraInfo(
         id=camera.id,
         name=camera.name,
         type=camera_type,
-        host=str(camera.host) if hasattr(camera, "host") and camera.host else None,
+        host=str(host) if host else None,
         is_adopted=camera.is_adopted,
-        state=str(camera.state) if camera.state else "Unknown",
-        last_seen=camera.last_seen if hasattr(camera, "last_seen") else None,
-        is_third_party=is_third_party,
+        state=camera.state.value if camera.state else "Unknown",
+        last_seen=camera.last_seen if _HAS_LAST_SEEN else None,  # type: ignore[attr-defined]
+        is_third_party=not camera_type.startswith("UVC"),
     )
 
 
@@ -66,6 +97,9 @@ class UnifiProtectClient:
         self.config = config
         self.include_unadopted = include_unadopted
         self._client: ProtectApiClient | None = None
+        self._ip_index: dict[str, str] = {}
+        self._info_cache: dict[str, tuple[Camera, CameraInfo]] = {}
+        self._snapshot: tuple[float, list[CameraInfo]] | None = None
 
     async def connect(self) -> None:
         """Connect to UniFi Protect and initialize the client.
@@ -73,24 +107,83 @@ class UnifiProtectClient:
         Raises:
             Exception: If connection fails.
         """
+        # Same cookie handling as uiprotect's default session, but keep idle
+        # connections open long enough for the next interactive command to
+        # reuse the TLS connection instead of handshaking again
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=PROTECT_CONNECTIONS_PER_HOST,
+                keepalive_timeout=PROTECT_KEEPALIVE_TIMEOUT,
+            ),
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+        )
         self._client = ProtectApiClient(
             host=self.config.address,
             port=self.config.port,
             username=self.config.username,
             password=self.config.password,
             verify_ssl=self.config.ssl_verify,
+            session=session,
             ignore_unadopted=not self.include_unadopted,
         )
         await self._client.update()
+        self._rebuild_ip_index()
+        self._snapshot = None
+
+    def _camera_info(self, camera: Camera) -> CameraInfo:
+        """Convert a bootstrap camera to CameraInfo, reusing earlier results.
+
+        Entries are keyed by camera ID and only reused while the bootstrap
+        still holds the same Camera object, so reloading the bootstrap
+        invalidates them. CameraInfo is frozen, so sharing is safe.
+
+        Args:
+            camera: Camera object from the bootstrap.
+
+        Returns:
+            CameraInfo for the camera.
+        """
+        cached = self._info_cache.get(camera.id)
+        if cached is not None and cached[0] is camera:
+            return cached[1]
+        info = camera_info_from_protect(camera)
+        self._info_cache[camera.id] = (camera, info)
+        return info
+
+    def _rebuild_ip_index(self) -> None:
+        """Rebuild the camera IP address to camera ID index from the bootstrap."""
+        self._ip_index = {
+            str(camera.host): camera.id
+            for camera in self.client.bootstrap.cameras.values()
+            if camera.host
+        }
 
     async def disconnect(self) -> None:
         """Disconnect from UniFi Protect and close the session."""
-        if self._client:
-            with contextlib.suppress(Exception):
-                await self._client.async_disconnect_ws()
-            with contextlib.suppress(Exception):
-                await self._client.close_session()
-            self._client = None
+        client, self._client = self._client, None
+        self._ip_index = {}
+        self._info_cache = {}
+        self._snapshot = None
+        if client is None:
+            return
+
+        # Websocket and session teardown are independent; overlap them
+        results = await asyncio.gather(
+            client.async_disconnect_ws(),
+            client.close_session(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, _DISCONNECT_ERRORS):
+                log_debug(f"Ignoring error during Protect disconnect: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def refresh(self) -> None:
+        """Reload the bootstrap over the existing session without logging in again."""
+        await self.client.update()
+        self._rebuild_ip_index()
+        self._snapshot = None
 
     @property
     def client(self) -> ProtectApiClient:
@@ -106,16 +199,40 @@ class UnifiProtectClient:
             raise RuntimeError("Client not connected. Call connect() first.")
         return self._client
 
-    async def list_cameras(self) -> list[CameraInfo]:
+    async def list_cameras(self, third_party_only: bool = False) -> list[CameraInfo]:
         """List all cameras (adopted and unadopted).
 
+        The full list is kept as a snapshot for CAMERA_SNAPSHOT_TTL seconds
+        (or until refresh()), so frequent polling does not rebuild it.
+
+        Args:
+            third_party_only: Only include third-party (non-UniFi) cameras.
+
         Returns:
-            List of CameraInfo objects for all cameras.
+            List of CameraInfo objects for all matching cameras.
+        """
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot[0] >= CAMERA_SNAPSHOT_TTL:
+            cameras = self.client.bootstrap.cameras.values()
+            self._snapshot = (now, list(map(self._camera_info, cameras)))
+        infos = self._snapshot[1]
+        if third_party_only:
+            return [info for info in infos if info.is_third_party]
+        return list(infos)
+
+    async def iter_cameras(self, third_party_only: bool = False) -> AsyncIterator[CameraInfo]:
+        """Iterate over cameras, converting each one as it is consumed.
+
+        Args:
+            third_party_only: Skip UniFi cameras before converting them.
+
+        Yields:
+            CameraInfo for each matching camera in the NVR bootstrap.
         """
-        cameras: list[CameraInfo] = []
         for camera in self.client.bootstrap.cameras.values():
-            cameras.append(camera_info_from_protect(camera))
-        return cameras
+            if third_party_only and not is_third_party_camera(camera):
+                continue
+            yield self._camera_info(camera)
 
     async def get_camera(self, camera_id: str) -> CameraInfo | None:
         """Get a specific camera by ID.
@@ -127,9 +244,7 @@ class UnifiProtectClient:
             CameraInfo if found, None otherwise.
         """
         camera = self.client.bootstrap.cameras.get(camera_id)
-        if camera:
-            return camera_info_from_protect(camera)
-        return None
+        return self._camera_info(camera) if camera is not None else None
 
     async def get_camera_by_ip(self, ip_address: str) -> CameraInfo | None:
         """Get a camera by its IP address.
@@ -140,10 +255,27 @@ class UnifiProtectClient:
         Returns:
             CameraInfo if found, None otherwise.
         """
-        for camera in self.client.bootstrap.cameras.values():
-            if hasattr(camera, "host") and camera.host == ip_address:
-                return camera_info_from_protect(camera)
-        return None
+        cameras = self.client.bootstrap.cameras
+        camera = cameras.get(self._ip_index.get(ip_address, ""))
+        if camera is None or str(camera.host) != ip_address:
+            # The bootstrap changed since the index was built; refresh it once
+            self._rebuild_ip_index()
+            camera = cameras.get(self._ip_index.get(ip_address, ""))
+        return self._camera_info(camera) if camera is not None else None
+
+    async def resolve_camera(self, key: str) -> CameraInfo | None:
+        """Get a camera by ID, falling back to IP address.
+
+        Both lookups read the bootstrap data already loaded by connect(),
+        so they run back to back without any network round-trip.
+
+        Args:
+            key: Camera ID or IP address.
+
+        Returns:
+            CameraInfo if found, None otherwise.
+        """
+        return await self.get_camera(key) or await self.get_camera_by_ip(key)
 
     async def adopt_camera(self, camera_id: str) -> bool:
         """Adopt an unadopted camera.
@@ -199,9 +331,82 @@ class UnifiProtectClient:
         except Exception as e:
             raise RuntimeError(f"Failed to reboot camera: {e}") from e
 
+    async def _run_batch(
+        self,
+        operation: Callable[[str], Awaitable[bool]],
+        camera_ids: list[str],
+        concurrency: int,
+    ) -> dict[str, bool | BaseException]:
+        """Run a per-camera operation on many cameras with bounded concurrency.
+
+        Args:
+            operation: Single-camera method such as adopt_camera.
+            camera_ids: Camera IDs to act on (duplicates are ignored).
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Mapping of camera ID to True, or to the exception the operation raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _guarded(camera_id: str) -> bool:
+            async with semaphore:
+                return await operation(camera_id)
+
+        unique_ids = list(dict.fromkeys(camera_ids))
+        results = await asyncio.gather(
+            *(_guarded(camera_id) for camera_id in unique_ids), return_exceptions=True
+        )
+        return dict(zip(unique_ids, results, strict=True))
+
+    async def adopt_cameras(
+        self, camera_ids: list[str], *, concurrency: int = 8
+    ) -> dict[str, bool | BaseException]:
+        """Adopt several cameras concurrently.
+
+        Args:
+            camera_ids: IDs of the cameras to adopt.
+            concurrency: Maximum number of adoptions in flight at once.
+
+        Returns:
+            Mapping of camera ID to True, or to the error raised for that camera.
+        """
+        return await self._run_batch(self.adopt_camera, camera_ids, concurrency)
+
+    async def unadopt_cameras(
+        self, camera_ids: list[str], *, concurrency: int = 8
+    ) -> dict[str, bool | BaseException]:
+        """Unadopt several cameras concurrently.
+
+        Args:
+            camera_ids: IDs of the cameras to unadopt.
+            concurrency: Maximum number of unadoptions in flight at once.
+
+        Returns:
+            Mapping of camera ID to True, or to the error raised for that camera.
+        """
+        return await self._run_batch(self.unadopt_camera, camera_ids, concurrency)
+
+    async def reboot_cameras(
+        self, camera_ids: list[str], *, concurrency: int = 8
+    ) -> dict[str, bool | BaseException]:
+        """Reboot several cameras concurrently.
+
+        Args:
+            camera_ids: IDs of the cameras to reboot.
+            concurrency: Maximum number of reboots in flight at once.
+
+        Returns:
+            Mapping of camera ID to True, or to the error raised for that camera.
+        """
+        return await self._run_batch(self.reboot_camera, camera_ids, concurrency)
+
     async def get_nvr_info(self) -> NvrInfo:
         """Get NVR information.
 
+        Reads the bootstrap loaded by connect(), so no request is sent to
+        the NVR.
+
         Returns:
             NvrInfo with NVR details.
         """
@@ -209,12 +414,28 @@ class UnifiProtectClient:
         return NvrInfo(
             id=nvr.id,
             name=nvr.name,
-            model=str(nvr.model) if nvr.model else "Unknown",
+            model=nvr.model.value if nvr.model else "Unknown",
             version=str(nvr.version) if nvr.version else None,
             host=str(nvr.host) if hasattr(nvr, "host") and nvr.host else None,
         )
 
 
+@dataclass
+class _ClientPool:
+    """Connected clients shared within one event loop, with reference counts."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    clients: dict[tuple[ProtectConfig, bool], tuple[UnifiProtectClient, int]] = field(
+        default_factory=dict
+    )
+
+
+# Sessions are bound to the loop that created them, so pool per event loop
+_client_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 @asynccontextmanager
 async def get_protect_client(
     config: ProtectConfig,
@@ -222,7 +443,9 @@ async def get_protect_client(
 ) -> AsyncIterator[UnifiProtectClient]:
     """Context manager for UniFi Protect client.
 
-    Provides automatic connection management with proper cleanup.
+    Provides automatic connection management with proper cleanup. Nested
+    or concurrent blocks with an equal config share one connected client,
+    which is disconnected when the last block exits.
 
     Args:
         config: UniFi Protect connection configuration.
@@ -235,9 +458,38 @@ async def get_protect_client(
         >>> async with get_protect_client(config) as client:
         ...     cameras = await client.list_cameras()
     """
-    client = UnifiProtectClient(config, include_unadopted)
+    loop = asyncio.get_running_loop()
+    pool = _client_pools.get(loop)
+    if pool is None:
+        pool = _client_pools[loop] = _ClientPool()
+    # The frozen config compares every connection setting, so blocks only
+    # share a client logged in with the same credentials and TLS options
+    key = (config, include_unadopted)
+
+    # Hold the lock while connecting so concurrent callers share one login
+    async with pool.lock:
+        if key in pool.clients:
+            client, refs = pool.clients[key]
+        else:
+            client, refs = UnifiProtectClient(config, include_unadopted), 0
+            try:
+                await client.connect()
+            except BaseException:
+                # Re-raise the connect failure, not an error from the cleanup
+                try:
+                    await client.disconnect()
+                except Exception as e:
+                    log_debug(f"Ignoring error during Protect disconnect: {e!r}")
+                raise
+        pool.clients[key] = (client, refs + 1)
+
     try:
-        await client.connect()
         yield client
     finally:
-        await client.disconnect()
+        async with pool.lock:
+            _, refs = pool.clients[key]
+            if refs > 1:
+                pool.clients[key] = (client, refs - 1)
+            else:
+                del pool.clients[key]
+                await client.disconnect()
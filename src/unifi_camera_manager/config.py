@@ -16,22 +16,30 @@ for backward compatibility but chezmoi templating is the recommended approach.
 import json
 import os
 import re
+import threading
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
 from platformdirs import user_config_dir, user_data_dir
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Use orjson's faster JSON codec for the Protect camera cache when installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 # Application identifiers for XDG paths
 APP_NAME = "ucam"
 APP_AUTHOR = "unifi-camera-manager"
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get XDG-compliant configuration directory.
+    """Get XDG-compliant configuration directory (cached).
 
     Returns:
         Path to configuration directory (~/.config/ucam on Linux/macOS).
@@ -40,12 +48,14 @@ def get_config_dir() -> Path:
         Creates the directory if it doesn't exist.
     """
     config_dir = Path(user_config_dir(APP_NAME, APP_AUTHOR))
-    config_dir.mkdir(parents=True, exist_ok=True)
+    if not config_dir.is_dir():
+        config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get XDG-compliant data directory.
+    """Get XDG-compliant data directory (cached).
 
     Returns:
         Path to data directory (~/.local/share/ucam on Linux/macOS).
@@ -54,7 +64,8 @@ def get_data_dir() -> Path:
         Creates the directory if it doesn't exist.
     """
     data_dir = Path(user_data_dir(APP_NAME, APP_AUTHOR))
-    data_dir.mkdir(parents=True, exist_ok=True)
+    if not data_dir.is_dir():
+        data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
@@ -96,6 +107,8 @@ class ProtectConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Instances are shared through the from_env cache
+        frozen=True,
     )
 
     username: str = Field(..., description="UniFi Protect username")
@@ -118,18 +131,59 @@ class ProtectConfig(BaseSettings):
 
         Raises:
             ValueError: If required environment variables are missing.
+
+        Note:
+            Results are cached per process, keyed by the .env file path, its
+            modification time and the current UFP_* environment variables.
         """
-        # Determine which env file to use
-        if env_file and env_file.exists():
-            return cls(_env_file=env_file)
+        path = _find_env_file(env_file)
+        mtime_ns = path.stat().st_mtime_ns if path is not None else 0
+        env_items = tuple(
+            sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("UFP_"))
+        )
+        return _load_protect_config(path, mtime_ns, env_items)
+
+
+def _find_env_file(env_file: Path | None = None) -> Path | None:
+    """Find the .env file to load Protect settings from.
 
-        # Check standard locations
-        for path in [Path(".env"), get_config_dir() / ".env"]:
-            if path.exists():
-                return cls(_env_file=path)
+    Args:
+        env_file: Optional explicit path to .env file.
 
-        # Try without env file (use system environment)
-        return cls()
+    Returns:
+        Path to the .env file, or None to use the system environment only.
+    """
+    if env_file and env_file.exists():
+        return env_file
+
+    # Check standard locations
+    for path in [Path(".env"), get_config_dir() / ".env"]:
+        if path.exists():
+            return path
+
+    return None
+
+
+@lru_cache(maxsize=8)
+def _load_protect_config(
+    env_file: Path | None,
+    mtime_ns: int,
+    env_items: tuple[tuple[str, str], ...],
+) -> ProtectConfig:
+    """Build and validate ProtectConfig (cached).
+
+    Args:
+        env_file: Path to .env file, or None to use the system environment.
+        mtime_ns: Modification time of env_file, part of the cache key only.
+        env_items: UFP_* environment variables, part of the cache key only.
+
+    Returns:
+        ProtectConfig instance.
+    """
+    if env_file is not None:
+        return ProtectConfig(_env_file=env_file)
+    # Try without env file (use system environment)
+    return ProtectConfig()
 
 
 # =============================================================================
@@ -236,6 +290,29 @@ class DevicesConfig(BaseModel):
 # =============================================================================
 
 
+# ${VAR_NAME} reference in a config value
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+def _env_var_value(match: re.Match[str]) -> str:
+    """Look up the environment variable named by a ${VAR_NAME} match.
+
+    Args:
+        match: Match of _ENV_VAR_PATTERN.
+
+    Returns:
+        The variable's value.
+
+    Raises:
+        ValueError: If the environment variable is not set.
+    """
+    var_name = match.group(1)
+    try:
+        return os.environ[var_name]
+    except KeyError:
+        raise ValueError(f"Environment variable '{var_name}' is not set") from None
+
+
 def interpolate_env_vars(value: str) -> str:
     """Interpolate environment variables in a string.
 
@@ -256,23 +333,18 @@ def interpolate_env_vars(value: str) -> str:
         >>> interpolate_env_vars("user:${MY_SECRET}")
         'user:password123'
     """
-    if not isinstance(value, str):
+    # Most values have no references; skip the regex for them
+    if not isinstance(value, str) or "${" not in value:
         return value
 
-    pattern = r"\$\{([^}]+)\}"
-
-    def replace(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        env_value = os.getenv(var_name)
-        if env_value is None:
-            raise ValueError(f"Environment variable '{var_name}' is not set")
-        return env_value
-
-    return re.sub(pattern, replace, value)
+    return _ENV_VAR_PATTERN.sub(_env_var_value, value)
 
 
 def interpolate_dict(data: dict[str, Any]) -> dict[str, Any]:
-    """Recursively interpolate environment variables in a dictionary.
+    """Interpolate environment variables throughout a nested dictionary.
+
+    Nested dicts and lists are walked with an explicit stack rather than
+    recursion, so deeply nested configs cost no extra Python frames.
 
     Args:
         data: Dictionary with string values that may contain ${VAR} references.
@@ -280,23 +352,27 @@ def interpolate_dict(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Dictionary with all environment variables interpolated.
     """
+    sub = _ENV_VAR_PATTERN.sub
+    replace = _env_var_value
+
     result: dict[str, Any] = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            result[key] = interpolate_env_vars(value)
-        elif isinstance(value, dict):
-            result[key] = interpolate_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                interpolate_dict(item)
-                if isinstance(item, dict)
-                else interpolate_env_vars(item)
-                if isinstance(item, str)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+    # (source container, destination container) pairs still to be copied
+    stack: list[tuple[Any, Any]] = [(data, result)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items() if isinstance(src, dict) else enumerate(src):
+            if isinstance(value, str):
+                if "${" in value:
+                    value = sub(replace, value)
+            elif isinstance(value, dict):
+                child: Any = {}
+                stack.append((value, child))
+                value = child
+            elif isinstance(value, list):
+                child = [None] * len(value)
+                stack.append((value, child))
+                value = child
+            dst[key] = value
     return result
 
 
@@ -314,6 +390,30 @@ def find_config_file(config_file: Path | None = None) -> Path:
     3. Platform-specific config directory (~/Library/Application Support/ucam/ on macOS)
     4. Current working directory (fallback for development)
 
+    Found paths are cached per process; failed searches are retried, and a
+    cached path that no longer exists triggers a fresh search.
+
+    Args:
+        config_file: Optional explicit path to config file.
+
+    Returns:
+        Path to configuration file.
+
+    Raises:
+        FileNotFoundError: If no configuration file is found.
+    """
+    path = _find_config_file(config_file)
+    if not path.exists():
+        # Moved or deleted since it was cached; search again
+        _find_config_file.cache_clear()
+        path = _find_config_file(config_file)
+    return path
+
+
+@lru_cache(maxsize=4)
+def _find_config_file(config_file: Path | None) -> Path:
+    """Search for the configuration file (cached).
+
     Args:
         config_file: Optional explicit path to config file.
 
@@ -350,18 +450,212 @@ def find_config_file(config_file: Path | None = None) -> Path:
     )
 
 
-@lru_cache(maxsize=1)
+def _load_yaml_file(config_file: Path) -> dict[str, Any]:
+    """Parse a YAML configuration file.
+
+    PyYAML is imported here rather than at module level so that commands
+    which never read config.yaml do not pay for importing it.
+
+    Args:
+        config_file: Path to YAML configuration file.
+
+    Returns:
+        Parsed YAML as dictionary.
+
+    Raises:
+        ValueError: If the file is not valid YAML.
+    """
+    import yaml
+
+    # Use libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Config files are small; read them in one call and let libyaml decode
+    # the bytes itself rather than pulling chunks through a file object
+    data = config_file.read_bytes()
+    try:
+        return yaml.load(data, Loader=loader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {config_file}: {e}") from e
+
+
+@lru_cache(maxsize=4)
+def _parse_config_file(
+    config_file: Path,
+    mtime_ns: int,
+    size: int,
+    inode: int,
+) -> dict[str, Any]:
+    """Read and parse a YAML configuration file (cached).
+
+    Args:
+        config_file: Path to YAML configuration file.
+        mtime_ns: File modification time, part of the cache key only.
+        size: File size in bytes, part of the cache key only.
+        inode: File inode, part of the cache key only.
+
+    Returns:
+        Parsed YAML as dictionary.
+    """
+    return _load_yaml_file(config_file)
+
+
+# Parsed config files kept while a filesystem watcher invalidates them
+_watched_configs: dict[Path, dict[str, Any]] = {}
+_watched_generation: dict[Path, int] = {}
+_watch_lock = threading.Lock()
+_watch_observer: Any = None
+
+
+def _invalidate_watched_config(config_file: Path) -> None:
+    """Drop a watched config file's parsed contents after it changed.
+
+    Args:
+        config_file: Resolved path to the configuration file.
+    """
+    with _watch_lock:
+        _watched_configs.pop(config_file, None)
+        _watched_generation[config_file] += 1
+
+
+def _watch_config_file(config_file: Path) -> bool:
+    """Start watching a config file for changes with watchdog.
+
+    Any event touching the file (modify, create, delete, or an atomic
+    replace moving onto it) calls `_invalidate_watched_config()`.
+
+    Args:
+        config_file: Resolved path to the configuration file.
+
+    Returns:
+        True if the file is watched, False if watchdog is not installed.
+    """
+    global _watch_observer
+
+    try:
+        from watchdog.events import (
+            EVENT_TYPE_CLOSED,
+            EVENT_TYPE_CREATED,
+            EVENT_TYPE_DELETED,
+            EVENT_TYPE_MODIFIED,
+            EVENT_TYPE_MOVED,
+            FileSystemEvent,
+            FileSystemEventHandler,
+        )
+        from watchdog.observers import Observer
+    except ImportError:
+        return False
+
+    # Opening the file to read it also raises events; only react to changes
+    change_events = {
+        EVENT_TYPE_CLOSED,
+        EVENT_TYPE_CREATED,
+        EVENT_TYPE_DELETED,
+        EVENT_TYPE_MODIFIED,
+        EVENT_TYPE_MOVED,
+    }
+
+    class _Invalidate(FileSystemEventHandler):
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            if event.event_type not in change_events:
+                return
+            if str(config_file) in (event.src_path, getattr(event, "dest_path", "")):
+                _invalidate_watched_config(config_file)
+
+    with _watch_lock:
+        if config_file in _watched_generation:
+            return True
+        if _watch_observer is None:
+            _watch_observer = Observer()
+            _watch_observer.daemon = True
+            _watch_observer.start()
+        _watched_generation[config_file] = 0
+        _watch_observer.schedule(_Invalidate(), str(config_file.parent))
+    return True
+
+
 def load_raw_config(config_file: Path) -> dict[str, Any]:
     """Load raw YAML configuration (cached).
 
+    The parsed result is reused until the file's modification time, size
+    or inode changes, so edits (including atomic replaces) are picked up
+    without re-parsing on every lookup.
+
+    With UCAM_WATCH_CONFIG set and watchdog installed, the file is watched
+    for filesystem events instead, so cached lookups skip the stat call.
+
     Args:
         config_file: Path to YAML configuration file.
 
     Returns:
         Parsed YAML as dictionary.
     """
-    with open(config_file) as f:
-        return yaml.safe_load(f) or {}
+    if os.getenv("UCAM_WATCH_CONFIG"):
+        path = config_file.resolve()
+        with _watch_lock:
+            cached = _watched_configs.get(path)
+            generation = _watched_generation.get(path)
+        if cached is not None:
+            return cached
+        if _watch_config_file(path):
+            if generation is None:
+                generation = 0
+            data = _load_yaml_file(path)
+            with _watch_lock:
+                # Only cache if the file did not change while it was parsed
+                if _watched_generation[path] == generation:
+                    _watched_configs[path] = data
+            return data
+
+    st = config_file.stat()
+    return _parse_config_file(config_file, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@dataclass(frozen=True)
+class _CamerasCacheEntry:
+    """Camera configs validated from one parsed config and environment."""
+
+    raw_config: dict[str, Any]
+    env_vars: tuple[str, ...]
+    env_values: tuple[str | None, ...]
+    cameras: tuple[OnvifCameraConfig, ...]
+    # Lowercased name and stripped IP address to camera; first entry wins
+    name_index: dict[str, OnvifCameraConfig]
+    ip_index: dict[str, OnvifCameraConfig]
+
+
+_cameras_cache: dict[Path, _CamerasCacheEntry] = {}
+
+
+def _env_var_names(data: Any) -> tuple[str, ...]:
+    """Collect the names of all ${VAR} references in a parsed config value.
+
+    Args:
+        data: Parsed YAML value (dict, list, string or scalar).
+
+    Returns:
+        Sorted, de-duplicated variable names.
+    """
+    names: set[str] = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if "${" in value:
+                names.update(_ENV_VAR_PATTERN.findall(value))
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return tuple(sorted(names))
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configuration file locations and contents."""
+    _find_config_file.cache_clear()
+    _parse_config_file.cache_clear()
+    _cameras_cache.clear()
+    with _watch_lock:
+        _watched_configs.clear()
 
 
 def load_cameras_config(
@@ -372,6 +666,9 @@ def load_cameras_config(
     Environment variables in the config are interpolated using ${VAR} syntax.
     This integrates with chezmoi's secret management via age encryption.
 
+    Validated configs are cached until the file or one of the referenced
+    environment variables changes.
+
     Args:
         config_file: Path to config.yaml. If None, searches standard locations.
 
@@ -387,18 +684,56 @@ def load_cameras_config(
         >>> for cam in cameras:
         ...     print(f"{cam.name}: {cam.ip_address}")
     """
+    return list(_load_cameras(config_file).cameras)
+
+
+def _load_cameras(config_file: Path | None = None) -> _CamerasCacheEntry:
+    """Load camera configurations and lookup indexes, reusing cached results.
+
+    Args:
+        config_file: Path to config.yaml. If None, searches standard locations.
+
+    Returns:
+        Cache entry with the validated cameras and their indexes.
+
+    Raises:
+        FileNotFoundError: If config file not found.
+        ValueError: If environment variables are missing.
+    """
     config_path = find_config_file(config_file)
     raw_config = load_raw_config(config_path)
 
-    devices = raw_config.get("devices", [])
-    cameras: list[OnvifCameraConfig] = []
+    # load_raw_config returns the same dict until the file changes
+    entry = _cameras_cache.get(config_path)
+    if (
+        entry is not None
+        and entry.raw_config is raw_config
+        and entry.env_values == tuple(map(os.environ.get, entry.env_vars))
+    ):
+        return entry
 
-    for device in devices:
-        # Interpolate environment variables in device config
-        interpolated = interpolate_dict(device)
-        cameras.append(OnvifCameraConfig(**interpolated))
+    devices = raw_config.get("devices", [])
+    # Interpolate environment variables in each device config
+    cameras = tuple(OnvifCameraConfig(**interpolate_dict(device)) for device in devices)
 
-    return cameras
+    name_index: dict[str, OnvifCameraConfig] = {}
+    ip_index: dict[str, OnvifCameraConfig] = {}
+    for camera in cameras:
+        if camera.name:
+            name_index.setdefault(camera.name.lower(), camera)
+        ip_index.setdefault(camera.ip_address.strip(), camera)
+
+    env_vars = _env_var_names(devices)
+    entry = _CamerasCacheEntry(
+        raw_config=raw_config,
+        env_vars=env_vars,
+        env_values=tuple(map(os.environ.get, env_vars)),
+        cameras=cameras,
+        name_index=name_index,
+        ip_index=ip_index,
+    )
+    _cameras_cache[config_path] = entry
+    return entry
 
 
 def get_default_credentials(
@@ -452,14 +787,7 @@ def get_camera_by_name(
     Returns:
         OnvifCameraConfig or None if not found.
     """
-    cameras = load_cameras_config(config_file)
-    name_lower = name.lower()
-
-    for camera in cameras:
-        if camera.name and camera.name.lower() == name_lower:
-            return camera
-
-    return None
+    return _load_cameras(config_file).name_index.get(name.lower())
 
 
 def get_camera_by_ip(
@@ -478,14 +806,7 @@ def get_camera_by_ip(
     Returns:
         OnvifCameraConfig or None if not found.
     """
-    cameras = load_cameras_config(config_file)
-    ip_normalized = ip_address.strip()
-
-    for camera in cameras:
-        if camera.ip_address.strip() == ip_normalized:
-            return camera
-
-    return None
+    return _load_cameras(config_file).ip_index.get(ip_address.strip())
 
 
 def _list_camera_names_raw(config_file: Path | None = None) -> list[str]:
@@ -505,9 +826,7 @@ def _list_camera_names_raw(config_file: Path | None = None) -> list[str]:
         if config_path is None:
             return []
 
-        with open(config_path) as f:
-            raw_config = yaml.safe_load(f)
-
+        raw_config = load_raw_config(config_path)
         if not raw_config:
             return []
 
@@ -518,7 +837,7 @@ def _list_camera_names_raw(config_file: Path | None = None) -> list[str]:
             if name and isinstance(name, str):
                 names.append(name)
         return names
-    except (OSError, yaml.YAMLError):
+    except (OSError, ValueError):
         return []
 
 
@@ -574,59 +893,72 @@ def save_protect_cameras_cache(cameras: list[dict[str, str]]) -> None:
     """
     cache_file = _get_protect_cache_file()
     try:
-        with open(cache_file, "w") as f:
-            json.dump(cameras, f, indent=2)
+        if orjson is not None:
+            cache_file.write_bytes(orjson.dumps(cameras, option=orjson.OPT_INDENT_2))
+        else:
+            with open(cache_file, "w") as f:
+                json.dump(cameras, f, indent=2)
     except OSError:
         pass  # Silently fail if cache can't be written
 
 
-def load_protect_cameras_cache() -> list[dict[str, str]]:
-    """Load UniFi Protect cameras from cache.
+def _protect_cache_key() -> tuple[Path, int, int] | None:
+    """Stat the Protect camera cache file for use as a cache key.
 
     Returns:
-        List of dicts with 'id', 'name', and optionally 'host' keys.
-        Returns empty list if cache doesn't exist or is invalid.
+        (path, mtime_ns, size), or None if the file does not exist.
     """
     cache_file = _get_protect_cache_file()
     try:
-        if cache_file.exists():
-            with open(cache_file) as f:
-                return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        pass
-    return []
+        st = cache_file.stat()
+    except OSError:
+        return None
+    return cache_file, st.st_mtime_ns, st.st_size
 
 
-def protect_camera_id_completion() -> list[str]:
-    """Get UniFi Protect camera IDs for shell completion.
+@lru_cache(maxsize=1)
+def _read_protect_cameras_cache(
+    cache_file: Path, mtime_ns: int, size: int
+) -> tuple[dict[str, str], ...]:
+    """Read and parse the Protect camera cache file (cached).
 
-    Returns completion options in format "id (name)" or just "id" if no name.
-    Run `ucam list` first to populate the cache.
+    Args:
+        cache_file: Path to protect_cameras.json.
+        mtime_ns: Modification time of cache_file, part of the cache key only.
+        size: Size of cache_file in bytes, part of the cache key only.
 
     Returns:
-        List of camera ID strings with optional names for display.
+        Cached camera entries, or an empty tuple if the file is invalid.
     """
-    cameras = load_protect_cameras_cache()
-    completions: list[str] = []
-
-    for cam in cameras:
-        cam_id = cam.get("id", "")
-        if cam_id:
-            completions.append(cam_id)
+    try:
+        data = cache_file.read_bytes()
+        cameras = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError, TypeError):
+        # orjson.JSONDecodeError and json.JSONDecodeError are ValueErrors
+        return ()
+    # Only a list of camera objects is a valid cache
+    if not isinstance(cameras, list) or not all(isinstance(cam, dict) for cam in cameras):
+        return ()
+    return tuple(cameras)
 
-    return completions
 
+@lru_cache(maxsize=1)
+def _protect_camera_completions(
+    cache_file: Path, mtime_ns: int, size: int
+) -> tuple[tuple[str, str], ...]:
+    """Build (camera ID, help text) completion pairs from the cache (cached).
 
-def protect_camera_completion_with_names() -> list[tuple[str, str]]:
-    """Get camera completions with help text for Typer.
+    Args:
+        cache_file: Path to protect_cameras.json.
+        mtime_ns: Modification time of cache_file, part of the cache key only.
+        size: Size of cache_file in bytes, part of the cache key only.
 
     Returns:
-        List of (value, help_text) tuples for rich completions.
+        Completion pairs for every cached camera with an ID.
     """
-    cameras = load_protect_cameras_cache()
     completions: list[tuple[str, str]] = []
 
-    for cam in cameras:
+    for cam in _read_protect_cameras_cache(cache_file, mtime_ns, size):
         cam_id = cam.get("id", "")
         cam_name = cam.get("name", "")
         cam_host = cam.get("host", "")
@@ -637,4 +969,42 @@ def protect_camera_completion_with_names() -> list[tuple[str, str]]:
                 help_text = f"{cam_name} ({cam_host})" if cam_name else cam_host
             completions.append((cam_id, help_text))
 
-    return completions
+    return tuple(completions)
+
+
+def load_protect_cameras_cache() -> list[dict[str, str]]:
+    """Load UniFi Protect cameras from cache.
+
+    The parsed file is reused until its modification time or size changes.
+
+    Returns:
+        List of dicts with 'id', 'name', and optionally 'host' keys.
+        Returns empty list if cache doesn't exist or is invalid.
+    """
+    key = _protect_cache_key()
+    if key is None:
+        return []
+    return list(_read_protect_cameras_cache(*key))
+
+
+def protect_camera_id_completion() -> list[str]:
+    """Get UniFi Protect camera IDs for shell completion.
+
+    Run `ucam list` first to populate the cache.
+
+    Returns:
+        List of camera ID strings.
+    """
+    return [cam_id for cam_id, _ in protect_camera_completion_with_names()]
+
+
+def protect_camera_completion_with_names() -> list[tuple[str, str]]:
+    """Get camera completions with help text for Typer.
+
+    Returns:
+        List of (value, help_text) tuples for rich completions.
+    """
+    key = _protect_cache_key()
+    if key is None:
+        return []
+    return list(_protect_camera_completions(*key))
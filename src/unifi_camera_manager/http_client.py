@@ -0,0 +1,90 @@
+"""Shared HTTP client for AXIS VAPIX API access.
+
+This module provides a process-wide httpx.AsyncClient that can be shared by
+the AXIS API clients (config, logs, LLDP, diagnostics) within one invocation.
+Sharing the client lets consecutive requests reuse pooled keep-alive
+connections instead of opening a new connection per client.
+
+The shared client is scoped with a context variable, so it is only visible
+to code running inside a `shared_http_client()` block.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import httpx
+
+# Default HTTP request timeout in seconds
+DEFAULT_TIMEOUT = 30.0
+
+# Keep-alive pool limits for the shared client
+DEFAULT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "ucam_shared_http_client", default=None
+)
+
+
+def create_http_client(timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Create an HTTP client configured for AXIS cameras.
+
+    Authentication is not bound to the client; callers pass their own
+    credentials per request so one client can serve many cameras.
+
+    Args:
+        timeout: HTTP request timeout in seconds.
+
+    Returns:
+        New httpx.AsyncClient instance.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=DEFAULT_LIMITS,
+        verify=False,  # AXIS cameras often use self-signed certs
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient | None:
+    """Get the shared HTTP client for the current context.
+
+    Returns:
+        Shared client if inside a `shared_http_client()` block, None otherwise.
+    """
+    return _shared_client.get()
+
+
+@asynccontextmanager
+async def shared_http_client(
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Context manager that shares one HTTP client across AXIS API clients.
+
+    Nested blocks reuse the outer client. The client is closed when the
+    outermost block exits.
+
+    Args:
+        timeout: HTTP request timeout in seconds.
+
+    Yields:
+        Shared httpx.AsyncClient instance.
+
+    Example:
+        >>> async with shared_http_client():
+        ...     async with AxisConfigClient(config) as client:
+        ...         cfg = await client.get_config()
+        ...     async with AxisLLDPClient(config) as client:
+        ...         neighbors = await client.get_neighbors()
+    """
+    existing = _shared_client.get()
+    if existing is not None:
+        yield existing
+        return
+
+    client = create_http_client(timeout)
+    token = _shared_client.set(client)
+    try:
+        yield client
+    finally:
+        _shared_client.reset(token)
+        await client.aclose()
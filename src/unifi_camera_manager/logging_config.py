@@ -2,12 +2,41 @@
 
 This module provides file-based logging configuration. When logging is enabled
 (via --log-file or log level), logs are written only to the specified file,
-not to stdout/stderr.
+not to stdout/stderr. Records are queued and written by a background thread,
+so logging calls do not block on file I/O.
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Background listeners writing queued records to log files, by logger name
+_listeners: dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Flush and stop the file listener for a logger, if one is running.
+
+    Args:
+        name: Logger name.
+    """
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _stop_all_listeners() -> None:
+    """Flush and stop all file listeners (registered with atexit)."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(_stop_all_listeners)
+
 
 def setup_logging(
     log_file: Path | str | None = None,
@@ -30,8 +59,9 @@ def setup_logging(
     """
     logger = logging.getLogger(name)
 
-    # Remove any existing handlers
+    # Remove any existing handlers, flushing records still queued for them
     logger.handlers.clear()
+    _stop_listener(name)
 
     if log_file is None:
         # Logging disabled - add null handler to prevent "No handler" warnings
@@ -61,8 +91,15 @@ def setup_logging(
     )
     file_handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(file_handler)
+    # Queue records and let a background thread write them to the file
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
 
     # Don't propagate to root logger (prevents stdout output)
     logger.propagate = False
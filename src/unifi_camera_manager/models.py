@@ -35,6 +35,16 @@ class LogLevel(str, Enum):
     DEBUG = "debug"
 
 
+# Lowercase level names and common syslog abbreviations to LogLevel
+LOG_LEVEL_MAP: dict[str, LogLevel] = {
+    **{level.value: level for level in LogLevel},
+    "emerg": LogLevel.EMERGENCY,
+    "crit": LogLevel.CRITICAL,
+    "err": LogLevel.ERROR,
+    "warn": LogLevel.WARNING,
+}
+
+
 class LogType(str, Enum):
     """Types of logs available from AXIS cameras."""
 
@@ -341,19 +351,7 @@ class LogEntry(BaseModel):
         if isinstance(v, LogLevel):
             return v
         if isinstance(v, str):
-            level_map = {
-                "emerg": LogLevel.EMERGENCY,
-                "alert": LogLevel.ALERT,
-                "crit": LogLevel.CRITICAL,
-                "err": LogLevel.ERROR,
-                "error": LogLevel.ERROR,
-                "warn": LogLevel.WARNING,
-                "warning": LogLevel.WARNING,
-                "notice": LogLevel.NOTICE,
-                "info": LogLevel.INFO,
-                "debug": LogLevel.DEBUG,
-            }
-            return level_map.get(v.lower(), LogLevel.INFO)
+            return LOG_LEVEL_MAP.get(v.lower(), LogLevel.INFO)
         return LogLevel.INFO
 
 
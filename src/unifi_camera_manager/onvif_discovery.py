@@ -2,13 +2,27 @@
 
 This module provides functions for verifying ONVIF camera accessibility,
 retrieving device information, and checking network connectivity.
+
+Inside a `shared_onvif_cameras()` block, calls for the same camera share
+one initialized ONVIFCamera (and its service bindings), so the xaddrs
+handshake runs once instead of once per call.
 """
 
 import asyncio
+import contextlib
+import ipaddress
 import os
+import socket
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
 
+import aiohttp
 import onvif
 from onvif import ONVIFCamera
+from onvif.exceptions import ONVIFError
+from zeep.exceptions import Error as ZeepError
 
 from .config import OnvifCameraConfig
 from .models import OnvifCameraInfo
@@ -16,8 +30,135 @@ from .models import OnvifCameraInfo
 # Get the correct WSDL path from the installed onvif package
 WSDL_DIR = os.path.join(os.path.dirname(onvif.__file__), "wsdl")
 
+# GetStreamUri setup for a unicast RTSP stream; onvif's service wrapper
+# copies dict arguments before zeep sees them, so one shared dict serves
+# every request
+RTSP_STREAM_SETUP: dict[str, Any] = {
+    "Stream": "RTP-Unicast",
+    "Transport": {"Protocol": "RTSP"},
+}
+
+# Errors that mean the camera could not answer a request: unreachable,
+# timed out, dropped the connection, or returned a SOAP fault or an HTTP
+# error (zeep raises TransportError/Fault unwrapped from service calls)
+_REQUEST_ERRORS = (ONVIFError, ZeepError, aiohttp.ClientError, OSError)
+
+# Upper bound on cameras contacted at once by the batch helpers
+DEFAULT_BATCH_CONCURRENCY = 32
+
+# Per-camera time limit for verify_many, in seconds
+DEFAULT_VERIFY_TIMEOUT = 10.0
+
+# Time limit for each ONVIF request (handshake, service setup, SOAP call),
+# in seconds; well below the onvif client's 90 second socket timeouts
+DEFAULT_REQUEST_TIMEOUT = 5.0
+
+_shared_cameras: ContextVar[dict[OnvifCameraConfig, asyncio.Task[ONVIFCamera]] | None] = ContextVar(
+    "ucam_shared_onvif_cameras", default=None
+)
+
+
+@asynccontextmanager
+async def shared_onvif_cameras() -> AsyncIterator[None]:
+    """Context manager that shares initialized ONVIF cameras between calls.
+
+    Nested blocks reuse the outer cameras. All cameras opened in the block
+    are closed when the outermost block exits.
+
+    Example:
+        >>> async with shared_onvif_cameras():
+        ...     info, uri = await asyncio.gather(
+        ...         verify_onvif_camera(config), get_onvif_stream_uri(config)
+        ...     )
+    """
+    if _shared_cameras.get() is not None:
+        yield
+        return
+
+    cameras: dict[OnvifCameraConfig, asyncio.Task[ONVIFCamera]] = {}
+    token = _shared_cameras.set(cameras)
+    try:
+        yield
+    finally:
+        _shared_cameras.reset(token)
+        # Openings still in flight close their own camera when cancelled
+        for task in cameras.values():
+            task.cancel()
+        results = await asyncio.gather(*cameras.values(), return_exceptions=True)
+        for result in results:
+            if not isinstance(result, BaseException):
+                await _close_camera(result)
+
+
+async def _open_camera(
+    config: OnvifCameraConfig, timeout: float = DEFAULT_REQUEST_TIMEOUT
+) -> ONVIFCamera:
+    """Create an ONVIFCamera and resolve its service addresses.
+
+    Args:
+        config: ONVIF camera configuration with IP address and credentials.
+        timeout: Time limit for the xaddrs handshake in seconds.
+
+    Returns:
+        Initialized camera, ready to create services.
+
+    Raises:
+        ConnectionError: If the camera's ONVIF port does not accept connections.
+        TimeoutError: If the xaddrs handshake takes longer than `timeout`.
+    """
+    # Fail fast on dead cameras instead of waiting out the SOAP client timeouts
+    if not await check_camera_connectivity(config.ip_address, config.port):
+        raise ConnectionError(f"Camera not reachable at {config.ip_address}:{config.port}")
+
+    # Create ONVIF camera instance with correct WSDL path
+    camera = ONVIFCamera(
+        config.ip_address,
+        config.port,
+        config.username,
+        config.password,
+        wsdl_dir=WSDL_DIR,
+    )
+    try:
+        await asyncio.wait_for(camera.update_xaddrs(), timeout)
+    except BaseException:
+        await _close_camera(camera)
+        raise
+    return camera
+
+
+@asynccontextmanager
+async def _camera(
+    config: OnvifCameraConfig, timeout: float = DEFAULT_REQUEST_TIMEOUT
+) -> AsyncIterator[ONVIFCamera]:
+    """Get an initialized camera, shared if inside `shared_onvif_cameras()`.
 
-async def verify_onvif_camera(config: OnvifCameraConfig) -> OnvifCameraInfo:
+    Args:
+        config: ONVIF camera configuration with IP address and credentials.
+        timeout: Time limit for the xaddrs handshake in seconds.
+
+    Yields:
+        Initialized ONVIFCamera; closed on exit unless it is shared.
+    """
+    cameras = _shared_cameras.get()
+    if cameras is None:
+        camera = await _open_camera(config, timeout)
+        try:
+            yield camera
+        finally:
+            await _close_camera(camera)
+        return
+
+    # Concurrent callers await the same task, so the camera is opened once
+    task = cameras.get(config)
+    if task is None:
+        task = cameras[config] = asyncio.create_task(_open_camera(config, timeout))
+    # Shielded so a caller that gives up does not cancel other callers' camera
+    yield await asyncio.shield(task)
+
+
+async def verify_onvif_camera(
+    config: OnvifCameraConfig, timeout: float = DEFAULT_REQUEST_TIMEOUT
+) -> OnvifCameraInfo:
     """Verify an ONVIF camera is accessible and retrieve its information.
 
     Connects to an ONVIF camera using the provided configuration and
@@ -26,6 +167,7 @@ async def verify_onvif_camera(config: OnvifCameraConfig) -> OnvifCameraInfo:
 
     Args:
         config: ONVIF camera configuration with IP address and credentials.
+        timeout: Time limit for each ONVIF request in seconds.
 
     Returns:
         OnvifCameraInfo with camera details if accessible, or error
@@ -40,21 +182,11 @@ async def verify_onvif_camera(config: OnvifCameraConfig) -> OnvifCameraInfo:
         ...     print(f"Error: {info.error}")
     """
     try:
-        # Create ONVIF camera instance with correct WSDL path
-        camera = ONVIFCamera(
-            config.ip_address,
-            config.port,
-            config.username,
-            config.password,
-            wsdl_dir=WSDL_DIR,
-        )
-
-        # Initialize and get device information
-        await camera.update_xaddrs()
-        device_service = await camera.create_devicemgmt_service()
+        async with _camera(config, timeout) as camera:
+            device_service = await asyncio.wait_for(camera.create_devicemgmt_service(), timeout)
 
-        # Get device information
-        device_info = await device_service.GetDeviceInformation()
+            # Get device information
+            device_info = await asyncio.wait_for(device_service.GetDeviceInformation(), timeout)
 
         return OnvifCameraInfo(
             manufacturer=device_info.Manufacturer or "Unknown",
@@ -64,6 +196,8 @@ async def verify_onvif_camera(config: OnvifCameraConfig) -> OnvifCameraInfo:
             hardware_id=device_info.HardwareId or "Unknown",
             is_accessible=True,
         )
+    except TimeoutError:
+        return OnvifCameraInfo(is_accessible=False, error=f"Timed out after {timeout:g}s")
     except Exception as e:
         return OnvifCameraInfo(
             manufacturer="",
@@ -76,7 +210,9 @@ async def verify_onvif_camera(config: OnvifCameraConfig) -> OnvifCameraInfo:
         )
 
 
-async def get_onvif_stream_uri(config: OnvifCameraConfig) -> str | None:
+async def get_onvif_stream_uri(
+    config: OnvifCameraConfig, timeout: float = DEFAULT_REQUEST_TIMEOUT
+) -> str | None:
     """Get the RTSP stream URI from an ONVIF camera.
 
     Connects to the camera and retrieves the RTSP stream URI for
@@ -84,6 +220,7 @@ async def get_onvif_stream_uri(config: OnvifCameraConfig) -> str | None:
 
     Args:
         config: ONVIF camera configuration with IP address and credentials.
+        timeout: Time limit for each ONVIF request in seconds.
 
     Returns:
         RTSP stream URI string or None if unavailable.
@@ -95,44 +232,68 @@ async def get_onvif_stream_uri(config: OnvifCameraConfig) -> str | None:
         ...     print(f"Stream: {uri}")
     """
     try:
-        camera = ONVIFCamera(
-            config.ip_address,
-            config.port,
-            config.username,
-            config.password,
-            wsdl_dir=WSDL_DIR,
-        )
+        async with _camera(config, timeout) as camera:
+            media_service = await asyncio.wait_for(camera.create_media_service(), timeout)
 
-        await camera.update_xaddrs()
-        media_service = await camera.create_media_service()
-
-        # Get profiles
-        profiles = await media_service.GetProfiles()
-        if not profiles:
-            return None
-
-        # Get stream URI for first profile
-        stream_setup = {
-            "Stream": "RTP-Unicast",
-            "Transport": {"Protocol": "RTSP"},
-        }
-        uri_response = await media_service.GetStreamUri(
-            {"StreamSetup": stream_setup, "ProfileToken": profiles[0].token}
-        )
+            # Get profiles
+            profiles = await asyncio.wait_for(media_service.GetProfiles(), timeout)
+            if not profiles:
+                return None
 
-        return uri_response.Uri
-    except Exception:
+            # Get stream URI for first profile, retrying once if the
+            # connection dropped after the profiles were fetched
+            request = {"StreamSetup": RTSP_STREAM_SETUP, "ProfileToken": profiles[0].token}
+            try:
+                uri_response = await asyncio.wait_for(media_service.GetStreamUri(request), timeout)
+            except _REQUEST_ERRORS as e:
+                if not _is_dropped_connection(e):
+                    raise
+                uri_response = await asyncio.wait_for(media_service.GetStreamUri(request), timeout)
+
+            return uri_response.Uri
+    except _REQUEST_ERRORS:
         return None
 
 
+def _is_dropped_connection(error: BaseException) -> bool:
+    """Check whether an error means the camera dropped the HTTP connection.
+
+    HTTP error responses (such as 401) are not included; retrying them
+    would fail the same way.
+
+    Args:
+        error: Exception raised by an ONVIF service call.
+
+    Returns:
+        True if the error (or the error it wraps) is an aiohttp connection
+        error, such as ServerDisconnectedError.
+    """
+    return isinstance(error, aiohttp.ClientConnectionError) or isinstance(
+        error.__cause__, aiohttp.ClientConnectionError
+    )
+
+
+async def _close_camera(camera: ONVIFCamera | None) -> None:
+    """Close an ONVIFCamera's aiohttp sessions, ignoring errors.
+
+    Args:
+        camera: Camera to close, or None if it was never created.
+    """
+    if camera is not None:
+        with contextlib.suppress(Exception):
+            await camera.close()
+
+
 async def check_camera_connectivity(ip_address: str, port: int = 80) -> bool:
     """Check if a camera is reachable on the network.
 
     Attempts to establish a TCP connection to the camera on the
-    specified port to verify network connectivity.
+    specified port to verify network connectivity. Hostnames are
+    resolved and every returned address is tried at once, so a broken
+    IPv6 route does not delay an answer over IPv4.
 
     Args:
-        ip_address: Camera IP address to check.
+        ip_address: Camera IP address or hostname to check.
         port: Port to check (default 80 for HTTP/ONVIF).
 
     Returns:
@@ -144,12 +305,147 @@ async def check_camera_connectivity(ip_address: str, port: int = 80) -> bool:
         ...     print("Camera is online")
     """
     try:
-        _, writer = await asyncio.wait_for(
-            asyncio.open_connection(ip_address, port),
-            timeout=5.0,
-        )
-        writer.close()
-        await writer.wait_closed()
-        return True
+        async with asyncio.timeout(5.0):
+            addresses = await _resolve_addresses(ip_address, port)
+            tasks = [asyncio.create_task(_try_connect(*address)) for address in addresses]
+            try:
+                for connected in asyncio.as_completed(tasks):
+                    if await connected:
+                        return True
+            finally:
+                for task in tasks:
+                    task.cancel()
     except (TimeoutError, OSError):
         return False
+    return False
+
+
+async def _resolve_addresses(host: str, port: int) -> list[tuple[int, tuple[Any, ...]]]:
+    """Resolve a host to the socket addresses to try connecting to.
+
+    IP addresses are used as-is without a resolver round trip.
+
+    Args:
+        host: IP address or hostname.
+        port: TCP port.
+
+    Returns:
+        List of (address family, socket address) pairs.
+
+    Raises:
+        OSError: If the hostname cannot be resolved.
+    """
+    try:
+        family = socket.AF_INET6 if ipaddress.ip_address(host).version == 6 else socket.AF_INET
+        return [(family, (host, port))]
+    except ValueError:
+        pass
+
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return list(dict.fromkeys((family, address) for family, _, _, _, address in infos))
+
+
+async def _try_connect(family: int, address: tuple[Any, ...]) -> bool:
+    """Open and close a TCP connection to one socket address.
+
+    A bare non-blocking socket is enough to test reachability; no stream
+    reader/writer or protocol objects are needed.
+
+    Args:
+        family: Address family (AF_INET or AF_INET6).
+        address: Socket address to connect to.
+
+    Returns:
+        True if the connection succeeded, False otherwise.
+    """
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
+            await asyncio.get_running_loop().sock_connect(sock, address)
+        return True
+    except OSError:
+        return False
+
+
+async def verify_many(
+    configs: list[OnvifCameraConfig],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    timeout: float = DEFAULT_VERIFY_TIMEOUT,
+) -> list[OnvifCameraInfo]:
+    """Verify several ONVIF cameras concurrently.
+
+    A camera that fails or times out is reported in its own result and
+    does not affect the others.
+
+    Args:
+        configs: ONVIF camera configurations to verify.
+        concurrency: Maximum number of cameras contacted at once.
+        timeout: Time limit per camera in seconds.
+
+    Returns:
+        OnvifCameraInfo for each config, in the same order.
+
+    Example:
+        >>> results = await verify_many(load_cameras_config())
+        >>> offline = [r for r in results if not r.is_accessible]
+    """
+
+    async def _verify(config: OnvifCameraConfig) -> OnvifCameraInfo:
+        try:
+            return await asyncio.wait_for(verify_onvif_camera(config), timeout)
+        except TimeoutError:
+            return OnvifCameraInfo(is_accessible=False, error=f"Timed out after {timeout:g}s")
+
+    return await _map_bounded(_verify, configs, concurrency)
+
+
+async def check_many(
+    ip_addresses: list[str],
+    port: int = 80,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[bool]:
+    """Check network connectivity to several cameras concurrently.
+
+    Args:
+        ip_addresses: Camera IP addresses to check.
+        port: Port to check on every camera.
+        concurrency: Maximum number of connection attempts at once.
+
+    Returns:
+        Reachability for each address, in the same order.
+    """
+
+    async def _check(ip_address: str) -> bool:
+        return await check_camera_connectivity(ip_address, port)
+
+    return await _map_bounded(_check, ip_addresses, concurrency)
+
+
+async def _map_bounded[T, R](
+    func: Callable[[T], Awaitable[R]], items: Sequence[T], concurrency: int
+) -> list[R]:
+    """Apply an async function to every item with bounded concurrency.
+
+    A fixed pool of workers pulls items from a shared iterator, so at most
+    `concurrency` coroutines exist at once however large the fleet is.
+
+    Args:
+        func: Coroutine function to apply to each item.
+        items: Items to process.
+        concurrency: Maximum number of calls in flight at once.
+
+    Returns:
+        Result for each item, in the same order.
+    """
+    pending = iter(enumerate(items))
+    results: dict[int, R] = {}
+
+    async def _worker() -> None:
+        for index, item in pending:
+            results[index] = await func(item)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(min(concurrency, len(items))):
+            group.create_task(_worker())
+
+    return [results[index] for index in range(len(items))]
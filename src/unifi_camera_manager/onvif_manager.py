@@ -26,6 +26,7 @@ from .models import (
     SystemInfo,
     VideoProfile,
 )
+from .onvif_discovery import RTSP_STREAM_SETUP
 
 # Get the correct WSDL path from the installed onvif package
 WSDL_DIR = os.path.join(os.path.dirname(onvif.__file__), "wsdl")
@@ -61,6 +62,7 @@ class OnvifCameraManager:
         self._ptz_service: Any = None
         self._imaging_service: Any = None
         self._profiles: list[Any] = []
+        self._capabilities: CameraCapabilities | None = None
 
     async def connect(self) -> None:
         """Connect to the camera and initialize ONVIF services.
@@ -120,6 +122,7 @@ class OnvifCameraManager:
         self._ptz_service = None
         self._imaging_service = None
         self._profiles = []
+        self._capabilities = None
 
     @property
     def is_connected(self) -> bool:
@@ -185,6 +188,9 @@ class OnvifCameraManager:
     async def get_capabilities(self) -> CameraCapabilities:
         """Get camera capabilities and supported features.
 
+        The result is cached for the lifetime of the connection, since
+        capabilities don't change while connected.
+
         Returns:
             CameraCapabilities with feature flags and supported encodings.
 
@@ -192,11 +198,15 @@ class OnvifCameraManager:
             RuntimeError: If not connected to camera.
         """
         self._ensure_connected()
+        if self._capabilities is not None:
+            return self._capabilities
 
         capabilities = CameraCapabilities()
+        fetched = False
 
         try:
             caps = await self._device_service.GetCapabilities({"Category": "All"})
+            fetched = True
 
             if hasattr(caps, "PTZ") and caps.PTZ:
                 capabilities.has_ptz = True
@@ -229,7 +239,7 @@ class OnvifCameraManager:
                     if encoding not in supported_encodings:
                         supported_encodings.append(encoding)
 
-        return CameraCapabilities(
+        result = CameraCapabilities(
             has_ptz=capabilities.has_ptz,
             has_audio=capabilities.has_audio,
             has_relay=capabilities.has_relay,
@@ -239,6 +249,10 @@ class OnvifCameraManager:
             supported_encodings=supported_encodings,
             max_profiles=len(self._profiles),
         )
+        # Retry on the next call if the request failed
+        if fetched:
+            self._capabilities = result
+        return result
 
     async def get_scopes(self) -> list[str]:
         """Get device scopes (ONVIF profile information).
@@ -329,13 +343,8 @@ class OnvifCameraManager:
 
         token = profile_token or self._profiles[0].token
 
-        stream_setup = {
-            "Stream": "RTP-Unicast",
-            "Transport": {"Protocol": "RTSP"},
-        }
-
         uri_response = await self._media_service.GetStreamUri(
-            {"StreamSetup": stream_setup, "ProfileToken": token}
+            {"StreamSetup": RTSP_STREAM_SETUP, "ProfileToken": token}
         )
 
         return StreamInfo(
@@ -31,6 +31,18 @@ from unifi_camera_manager.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the data directory at a temporary path for every test.
+
+    Keeps tests from writing cache files into the real ~/.local/share/ucam.
+    """
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr("unifi_camera_manager.config.get_data_dir", lambda: data_dir)
+    return data_dir
+
+
 @pytest.fixture
 def sample_camera_info() -> CameraInfo:
     """Create a sample CameraInfo for testing."""
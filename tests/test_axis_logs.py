@@ -21,6 +21,7 @@ from unifi_camera_manager.axis_logs import (
     parse_log_line,
 )
 from unifi_camera_manager.config import OnvifCameraConfig
+from unifi_camera_manager.http_client import create_http_client, shared_http_client
 from unifi_camera_manager.models import LogLevel, LogType
 
 
@@ -210,6 +211,46 @@ class TestAxisLogClient:
 
         assert client._client is None
 
+    @pytest.mark.asyncio
+    async def test_context_manager_uses_injected_client(
+        self, client_config: OnvifCameraConfig
+    ) -> None:
+        """Test an injected HTTP client is used and left open on exit."""
+        http_client = create_http_client()
+        try:
+            async with AxisLogClient(client_config, http_client=http_client) as client:
+                assert client._client is http_client
+
+            assert client._client is None
+            assert not http_client.is_closed
+        finally:
+            await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_uses_shared_client(
+        self, client_config: OnvifCameraConfig
+    ) -> None:
+        """Test clients inside shared_http_client() reuse one HTTP client."""
+        async with shared_http_client() as shared:
+            async with AxisLogClient(client_config) as first:
+                assert first._client is shared
+            async with AxisLogClient(client_config) as second:
+                assert second._client is shared
+            assert not shared.is_closed
+
+        assert shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_shared_client_uses_own_timeout(self, client_config: OnvifCameraConfig) -> None:
+        """Test requests over a shared HTTP client use the log client's timeout."""
+        response = MagicMock(content=b"report")
+        async with shared_http_client() as shared:
+            with patch.object(shared, "get", AsyncMock(return_value=response)) as mock_get:
+                async with AxisLogClient(client_config, timeout=7.5) as client:
+                    await client.get_server_report()
+
+        assert mock_get.call_args.kwargs["timeout"] == 7.5
+
     def test_find_log_content_system(self, client_config: OnvifCameraConfig) -> None:
         """Test _find_log_content for system logs."""
         client = AxisLogClient(client_config)
@@ -0,0 +1,97 @@
+"""Tests for the CLI command helpers.
+
+This module drives the shell loop and command implementations with a
+patched console and fake cameras, so no NVR, camera or terminal is needed.
+"""
+
+import asyncio
+import gc
+import signal
+import threading
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from unifi_camera_manager import cli
+
+
+class TestShellLoop:
+    """Tests for the shared shell read-dispatch loop."""
+
+    def test_dispatches_lines_until_exit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test each parsed line is dispatched and 'exit' ends the loop."""
+        lines = iter(["list --json", "", "info 'Front Door'", "exit", "never"])
+        monkeypatch.setattr(cli.console, "input", lambda prompt: next(lines))
+        dispatch = AsyncMock()
+
+        cli.run_async(cli._shell_loop("ucam", dispatch))
+        cli._close_runner()
+
+        assert [call.args[0] for call in dispatch.await_args_list] == [
+            ["list", "--json"],
+            ["info", "Front Door"],
+        ]
+
+    @pytest.mark.parametrize("error", [EOFError, KeyboardInterrupt])
+    def test_prompt_interrupt_ends_shell(
+        self, monkeypatch: pytest.MonkeyPatch, error: type[BaseException]
+    ) -> None:
+        """Test Ctrl-C or EOF at the prompt ends the shell and the runner closes."""
+        handlers = []
+
+        def _input(prompt: str) -> str:
+            handlers.append(signal.getsignal(signal.SIGINT))
+            raise error
+
+        monkeypatch.setattr(cli.console, "input", _input)
+        dispatch = AsyncMock()
+        threads_before = threading.active_count()
+
+        cli.run_async(cli._shell_loop("ucam", dispatch))
+        cli._close_runner()
+
+        # Ctrl-C raises at the prompt instead of only cancelling the task
+        assert handlers == [signal.default_int_handler]
+        assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+        # No reader thread is left behind for the runner shutdown to wait on
+        assert threading.active_count() == threads_before
+        dispatch.assert_not_awaited()
+
+
+class TestOnvifInfo:
+    """Tests for the concurrent ONVIF info command."""
+
+    @pytest.mark.asyncio
+    async def test_failure_settles_other_requests(self) -> None:
+        """Test a failed request cancels and awaits the others before returning."""
+        cancelled = asyncio.Event()
+
+        async def _hang() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        cam = MagicMock()
+        cam.get_system_info = AsyncMock(side_effect=RuntimeError("system info failed"))
+        cam.get_capabilities = AsyncMock(side_effect=ValueError("capabilities failed"))
+        cam.get_profiles = _hang
+        cam.get_all_stream_uris = _hang
+        cam.get_snapshot_uri = AsyncMock(return_value=None)
+
+        loop = asyncio.get_running_loop()
+        unretrieved: list[dict[str, Any]] = []
+        loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+        try:
+            with pytest.raises(RuntimeError, match="system info failed"):
+                await cli._onvif_info_impl(cam)
+            # Requests are finished when the command returns, not just cancelled
+            assert cancelled.is_set()
+            assert all(task is asyncio.current_task() for task in asyncio.all_tasks())
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert unretrieved == []
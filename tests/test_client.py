@@ -0,0 +1,312 @@
+"""Tests for the UniFi Protect client wrapper.
+
+This module tests UnifiProtectClient and get_protect_client against a
+mocked uiprotect ProtectApiClient, so no NVR is needed.
+"""
+
+import asyncio
+from collections.abc import Generator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from unifi_camera_manager import client as client_module
+from unifi_camera_manager.client import (
+    CAMERA_SNAPSHOT_TTL,
+    UnifiProtectClient,
+    get_protect_client,
+)
+from unifi_camera_manager.config import ProtectConfig
+
+
+def make_camera(camera_id: str, host: str | None, camera_type: str = "UVC G4 Bullet") -> Any:
+    """Create a fake uiprotect Camera with the fields CameraInfo reads."""
+    return SimpleNamespace(
+        id=camera_id,
+        name=f"Camera {camera_id}",
+        type=camera_type,
+        host=host,
+        is_adopted=True,
+        state=SimpleNamespace(value="CONNECTED"),
+        last_seen=None,
+    )
+
+
+@pytest.fixture
+def protect_config() -> ProtectConfig:
+    """Create a ProtectConfig for a test NVR."""
+    return ProtectConfig(username="admin", password="secret", address="192.168.1.1")
+
+
+@pytest.fixture
+def protect_api() -> Generator[MagicMock, None, None]:
+    """Patch ProtectApiClient with a mock holding two cameras in its bootstrap."""
+    api = MagicMock()
+    api.bootstrap.cameras = {
+        "cam1": make_camera("cam1", "192.168.1.10"),
+        "cam2": make_camera("cam2", "192.168.1.11", camera_type="AXIS P3245"),
+    }
+    for method in (
+        "update",
+        "async_disconnect_ws",
+        "close_session",
+        "adopt_device",
+        "unadopt_device",
+        "reboot_device",
+    ):
+        setattr(api, method, AsyncMock())
+
+    with (
+        patch.object(client_module, "ProtectApiClient", return_value=api) as factory,
+        patch.object(client_module.aiohttp, "ClientSession"),
+        patch.object(client_module.aiohttp, "TCPConnector"),
+    ):
+        api.factory = factory
+        yield api
+
+
+class TestGetProtectClient:
+    """Tests for the per-loop pooled get_protect_client."""
+
+    @pytest.mark.asyncio
+    async def test_nested_blocks_share_one_client(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test nested blocks reuse one login and close on the last exit."""
+        async with get_protect_client(protect_config) as outer:
+            async with get_protect_client(protect_config) as inner:
+                assert inner is outer
+            protect_api.close_session.assert_not_awaited()
+
+        protect_api.factory.assert_called_once()
+        protect_api.update.assert_awaited_once()
+        protect_api.close_session.assert_awaited_once()
+        protect_api.async_disconnect_ws.assert_awaited_once()
+        assert not client_module._client_pools[asyncio.get_running_loop()].clients
+
+    @pytest.mark.asyncio
+    async def test_concurrent_blocks_share_one_login(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test concurrent blocks in one loop wait for a single connect."""
+
+        async def _use() -> UnifiProtectClient:
+            async with get_protect_client(protect_config) as client:
+                await asyncio.sleep(0)
+                return client
+
+        first, second = await asyncio.gather(_use(), _use())
+
+        assert first is second
+        protect_api.update.assert_awaited_once()
+        protect_api.close_session.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_options_get_separate_clients(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test the pool is keyed by include_unadopted as well as the NVR."""
+        async with (
+            get_protect_client(protect_config) as first,
+            get_protect_client(protect_config, include_unadopted=False) as second,
+        ):
+            assert first is not second
+
+        assert protect_api.close_session.await_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("change", [{"password": "other"}, {"ssl_verify": True}])
+    async def test_connection_settings_get_separate_clients(
+        self, protect_config: ProtectConfig, protect_api: MagicMock, change: dict[str, Any]
+    ) -> None:
+        """Test configs differing in credentials or TLS options never share a client."""
+        other_config = protect_config.model_copy(update=change)
+
+        async with (
+            get_protect_client(protect_config) as first,
+            get_protect_client(other_config) as second,
+        ):
+            assert first is not second
+
+        assert protect_api.factory.call_count == 2
+
+    def test_clients_are_not_shared_across_loops(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test each event loop connects its own client."""
+
+        async def _use() -> None:
+            async with get_protect_client(protect_config):
+                pass
+
+        asyncio.run(_use())
+        asyncio.run(_use())
+
+        assert protect_api.factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_is_not_pooled(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test a failed login closes the session and leaves the pool empty."""
+        protect_api.update.side_effect = OSError("unreachable")
+
+        with pytest.raises(OSError, match="unreachable"):
+            async with get_protect_client(protect_config):
+                pass
+
+        protect_api.close_session.assert_awaited_once()
+        assert not client_module._client_pools[asyncio.get_running_loop()].clients
+
+    @pytest.mark.asyncio
+    async def test_failed_cleanup_keeps_connect_error(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test an error while closing after a failed login does not replace the login error."""
+        protect_api.update.side_effect = OSError("unreachable")
+        protect_api.close_session.side_effect = ValueError("session already closed")
+
+        with pytest.raises(OSError, match="unreachable"):
+            async with get_protect_client(protect_config):
+                pass
+
+        protect_api.async_disconnect_ws.assert_awaited_once()
+        assert not client_module._client_pools[asyncio.get_running_loop()].clients
+
+
+class TestUnifiProtectClientCaching:
+    """Tests for the camera snapshot, CameraInfo cache and IP index."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_until_ttl_expires(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test list_cameras reuses its snapshot for CAMERA_SNAPSHOT_TTL seconds."""
+        now = 1000.0
+        with patch.object(client_module.time, "monotonic", side_effect=lambda: now):
+            async with get_protect_client(protect_config) as client:
+                assert len(await client.list_cameras()) == 2
+
+                protect_api.bootstrap.cameras["cam3"] = make_camera("cam3", "192.168.1.12")
+                now += CAMERA_SNAPSHOT_TTL / 2
+                assert len(await client.list_cameras()) == 2
+
+                now += CAMERA_SNAPSHOT_TTL
+                assert len(await client.list_cameras()) == 3
+
+    @pytest.mark.asyncio
+    async def test_third_party_filter(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test third_party_only filters the snapshot."""
+        async with get_protect_client(protect_config) as client:
+            cameras = await client.list_cameras(third_party_only=True)
+
+        assert [camera.id for camera in cameras] == ["cam2"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_invalidates_snapshot_and_ip_index(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test refresh() rebuilds the snapshot and IP index from the new bootstrap."""
+        async with get_protect_client(protect_config) as client:
+            await client.list_cameras()
+
+            protect_api.bootstrap.cameras = {"cam9": make_camera("cam9", "192.168.1.10")}
+            await client.refresh()
+
+            assert [camera.id for camera in await client.list_cameras()] == ["cam9"]
+            assert client._ip_index == {"192.168.1.10": "cam9"}
+            assert protect_api.update.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ip_index_rebuilt_on_miss(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test a camera whose address changed is found without a refresh()."""
+        async with get_protect_client(protect_config) as client:
+            protect_api.bootstrap.cameras["cam1"] = make_camera("cam1", "192.168.1.50")
+
+            moved = await client.get_camera_by_ip("192.168.1.50")
+            stale = await client.get_camera_by_ip("192.168.1.10")
+
+        assert moved is not None
+        assert moved.id == "cam1"
+        assert stale is None
+
+    @pytest.mark.asyncio
+    async def test_camera_info_reused_while_camera_unchanged(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test CameraInfo is cached per Camera object identity."""
+        async with get_protect_client(protect_config) as client:
+            first = await client.get_camera("cam1")
+            assert await client.get_camera("cam1") is first
+
+            protect_api.bootstrap.cameras["cam1"] = make_camera("cam1", "192.168.1.10")
+            replaced = await client.get_camera("cam1")
+
+        assert replaced is not first
+        assert replaced == first
+
+
+class TestUnifiProtectClientBatch:
+    """Tests for the concurrent adopt/unadopt/reboot helpers."""
+
+    @pytest.mark.asyncio
+    async def test_adopt_cameras_reports_partial_failures(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test one failing camera is reported without affecting the others."""
+
+        async def _adopt(model_type: Any, camera_id: str) -> None:
+            if camera_id == "bad":
+                raise ValueError("rejected")
+
+        protect_api.adopt_device.side_effect = _adopt
+
+        async with get_protect_client(protect_config) as client:
+            results = await client.adopt_cameras(["cam1", "bad", "cam2", "cam1"])
+
+        assert list(results) == ["cam1", "bad", "cam2"]
+        assert results["cam1"] is True
+        assert results["cam2"] is True
+        assert isinstance(results["bad"], RuntimeError)
+        assert "rejected" in str(results["bad"])
+        assert protect_api.adopt_device.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test no more than `concurrency` operations run at once."""
+        in_flight = peak = 0
+
+        async def _reboot(model_type: Any, camera_id: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        protect_api.reboot_device.side_effect = _reboot
+        camera_ids = [f"cam{i}" for i in range(10)]
+
+        async with get_protect_client(protect_config) as client:
+            results = await client.reboot_cameras(camera_ids, concurrency=3)
+
+        assert all(result is True for result in results.values())
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_unadopt_cameras(
+        self, protect_config: ProtectConfig, protect_api: MagicMock
+    ) -> None:
+        """Test unadopt_cameras calls unadopt_device for each camera."""
+        async with get_protect_client(protect_config) as client:
+            results = await client.unadopt_cameras(["cam1", "cam2"])
+
+        assert results == {"cam1": True, "cam2": True}
+        assert protect_api.unadopt_device.await_count == 2
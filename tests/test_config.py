@@ -7,15 +7,20 @@ interpolation, and XDG path handling in unifi_camera_manager.config.
 import os
 from collections.abc import Generator
 from pathlib import Path
+from types import ModuleType
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
 
+from unifi_camera_manager import config as config_module
 from unifi_camera_manager.config import (
     APP_NAME,
     OnvifCameraConfig,
     ProtectConfig,
+    _find_config_file,
+    _invalidate_watched_config,
+    clear_config_cache,
     find_config_file,
     get_camera_by_name,
     get_config_dir,
@@ -25,10 +30,28 @@ from unifi_camera_manager.config import (
     interpolate_env_vars,
     list_camera_names,
     load_cameras_config,
+    load_protect_cameras_cache,
     load_raw_config,
+    protect_camera_completion_with_names,
+    save_protect_cameras_cache,
 )
 
 
+@pytest.fixture
+def config_watch() -> Generator[ModuleType, None, None]:
+    """Allow config file watching, stopping the watchdog observer afterwards."""
+    pytest.importorskip("watchdog")
+    yield config_module
+
+    with config_module._watch_lock:
+        observer, config_module._watch_observer = config_module._watch_observer, None
+        config_module._watched_configs.clear()
+        config_module._watched_generation.clear()
+    if observer is not None:
+        observer.stop()
+        observer.join()
+
+
 class TestXDGPaths:
     """Tests for XDG Base Directory Specification compliance."""
 
@@ -196,6 +219,26 @@ class TestProtectConfig:
         config = ProtectConfig()
         assert config.ssl_verify is False
 
+    def test_config_frozen(self) -> None:
+        """Test ProtectConfig is immutable."""
+        config = ProtectConfig()
+        with pytest.raises(ValidationError):
+            config.port = 8443  # type: ignore[misc]
+
+    def test_from_env_cached(self, tmp_path: Path) -> None:
+        """Test from_env reuses the parsed config until the environment changes."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("UFP_PORT=7443\n")
+
+        first = ProtectConfig.from_env(env_file)
+        assert first.port == 7443
+        assert ProtectConfig.from_env(env_file) is first
+
+        os.environ["UFP_ADDRESS"] = "192.168.1.2"
+        second = ProtectConfig.from_env(env_file)
+        assert second is not first
+        assert second.address == "192.168.1.2"
+
 
 class TestConfigFileLoading:
     """Tests for configuration file loading functions."""
@@ -205,6 +248,38 @@ class TestConfigFileLoading:
         found = find_config_file(sample_config_yaml)
         assert found == sample_config_yaml
 
+    def test_find_config_file_cached(self, tmp_path: Path) -> None:
+        """Test a found config path is reused without searching again."""
+        clear_config_cache()
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("devices: []\n")
+        assert find_config_file(config_file) == config_file
+        assert find_config_file(config_file) == config_file
+
+        assert _find_config_file.cache_info().hits == 1
+
+    def test_find_config_file_cache_drops_deleted_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cached path is not returned after the file is deleted."""
+        monkeypatch.chdir(tmp_path)
+        clear_config_cache()
+        first = tmp_path / "config.yaml"
+        second = tmp_path / "config.yml"
+        first.write_text("devices: []\n")
+        second.write_text("devices: []\n")
+
+        with (
+            patch("unifi_camera_manager.config.Path.home", return_value=tmp_path / "home"),
+            patch("unifi_camera_manager.config.get_config_dir", return_value=tmp_path),
+        ):
+            assert find_config_file(None) == first
+            first.unlink()
+            assert find_config_file(None) == second
+            second.unlink()
+            with pytest.raises(FileNotFoundError):
+                find_config_file(None)
+
     def test_find_config_file_not_found(self, tmp_path: Path) -> None:
         """Test find_config_file raises when file not found."""
         nonexistent = tmp_path / "nonexistent.yaml"
@@ -217,14 +292,14 @@ class TestConfigFileLoading:
     def test_load_raw_config(self, sample_config_yaml: Path) -> None:
         """Test loading raw YAML configuration."""
         # Clear the lru_cache to ensure fresh load
-        load_raw_config.cache_clear()
+        clear_config_cache()
         config = load_raw_config(sample_config_yaml)
         assert "devices" in config
         assert len(config["devices"]) == 2
 
     def test_load_cameras_config(self, sample_config_yaml: Path) -> None:
         """Test loading camera configurations from YAML."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         cameras = load_cameras_config(sample_config_yaml)
         assert len(cameras) == 2
         assert cameras[0].name == "Front Door"
@@ -237,39 +312,79 @@ class TestConfigFileLoading:
         env_vars_for_config: None,
     ) -> None:
         """Test loading config with environment variable interpolation."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         cameras = load_cameras_config(sample_config_yaml_with_env_vars)
         assert len(cameras) == 1
         assert cameras[0].username == "test_admin"
         assert cameras[0].password == "test_password"
 
+    def test_load_cameras_config_cached_until_env_changes(
+        self,
+        sample_config_yaml_with_env_vars: Path,
+        env_vars_for_config: None,
+    ) -> None:
+        """Test validated cameras are reused until a referenced env var changes."""
+        clear_config_cache()
+        first = load_cameras_config(sample_config_yaml_with_env_vars)
+        assert load_cameras_config(sample_config_yaml_with_env_vars)[0] is first[0]
+
+        os.environ["CAMERA_PASS"] = "rotated"
+        cameras = load_cameras_config(sample_config_yaml_with_env_vars)
+        assert cameras[0].password == "rotated"
+
+    def test_load_raw_config_reloads_on_change(self, tmp_path: Path) -> None:
+        """Test cached config is reused until the file changes."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("devices: []\n")
+
+        first = load_raw_config(config_file)
+        assert load_raw_config(config_file) is first
+
+        config_file.write_text("devices:\n  - name: New\n")
+        assert load_raw_config(config_file)["devices"] == [{"name": "New"}]
+
+    def test_load_raw_config_watch_mode(self, tmp_path: Path, config_watch: ModuleType) -> None:
+        """Test watched config is reused until the watcher invalidates it."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("devices: []\n")
+
+        with patch.dict(os.environ, {"UCAM_WATCH_CONFIG": "1"}):
+            first = load_raw_config(config_file)
+            assert load_raw_config(config_file) is first
+            assert config_watch._watch_observer is not None
+
+            # Stand in for the filesystem event rather than waiting on it
+            config_file.write_text("devices:\n  - name: New\n")
+            _invalidate_watched_config(config_file.resolve())
+            assert load_raw_config(config_file)["devices"] == [{"name": "New"}]
+
 
 class TestCameraLookup:
     """Tests for camera lookup functions."""
 
     def test_get_camera_by_name_found(self, sample_config_yaml: Path) -> None:
         """Test finding a camera by name."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         camera = get_camera_by_name("Front Door", sample_config_yaml)
         assert camera is not None
         assert camera.ip_address == "192.168.1.100"
 
     def test_get_camera_by_name_case_insensitive(self, sample_config_yaml: Path) -> None:
         """Test camera lookup is case-insensitive."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         camera = get_camera_by_name("front door", sample_config_yaml)
         assert camera is not None
         assert camera.name == "Front Door"
 
     def test_get_camera_by_name_not_found(self, sample_config_yaml: Path) -> None:
         """Test camera lookup returns None when not found."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         camera = get_camera_by_name("Nonexistent Camera", sample_config_yaml)
         assert camera is None
 
     def test_list_camera_names(self, sample_config_yaml: Path) -> None:
         """Test listing all camera names."""
-        load_raw_config.cache_clear()
+        clear_config_cache()
         names = list_camera_names(sample_config_yaml)
         assert "Front Door" in names
         assert "Back Yard" in names
@@ -283,3 +398,29 @@ class TestCameraLookup:
         ):
             names = list_camera_names(tmp_path / "nonexistent.yaml")
             assert names == []
+
+
+class TestProtectCamerasCache:
+    """Tests for the UniFi Protect camera completion cache."""
+
+    def test_cache_reloads_after_save(self, tmp_path: Path) -> None:
+        """Test cached completions are rebuilt when the cache file is rewritten."""
+        with patch("unifi_camera_manager.config.get_data_dir", return_value=tmp_path):
+            assert load_protect_cameras_cache() == []
+
+            save_protect_cameras_cache([{"id": "abc", "name": "Front", "host": "10.0.0.5"}])
+            assert protect_camera_completion_with_names() == [("abc", "Front (10.0.0.5)")]
+
+            save_protect_cameras_cache([{"id": "def", "name": "Back"}, {"name": "No ID"}])
+            assert protect_camera_completion_with_names() == [("def", "Back")]
+
+    @pytest.mark.parametrize(
+        "content",
+        ['{"id": "abc", "name": "Front"}', '"abc"', '["abc", {"id": "def"}]', "not json"],
+    )
+    def test_invalid_cache_is_ignored(self, tmp_path: Path, content: str) -> None:
+        """Test a cache that is not a list of camera objects yields no completions."""
+        (tmp_path / "protect_cameras.json").write_text(content)
+        with patch("unifi_camera_manager.config.get_data_dir", return_value=tmp_path):
+            assert load_protect_cameras_cache() == []
+            assert protect_camera_completion_with_names() == []
@@ -329,6 +329,17 @@ class TestLogEntry:
         )
         assert entry.level == LogLevel.ERROR
 
+    def test_log_entry_level_normalization_full_name(self) -> None:
+        """Test LogEntry accepts full level names in any case."""
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            hostname="test",
+            level="CRITICAL",  # type: ignore[arg-type]
+            message="Critical message",
+            raw="raw log line",
+        )
+        assert entry.level == LogLevel.CRITICAL
+
     def test_log_entry_unknown_level_defaults_to_info(self) -> None:
         """Test LogEntry with unknown level defaults to INFO."""
         entry = LogEntry(
@@ -0,0 +1,294 @@
+"""Tests for ONVIF camera discovery and verification.
+
+This module tests the discovery helpers against fake ONVIF cameras, so no
+network access or real camera is needed.
+"""
+
+import asyncio
+import socket
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from zeep.exceptions import TransportError
+
+from unifi_camera_manager import onvif_discovery
+from unifi_camera_manager.config import OnvifCameraConfig
+from unifi_camera_manager.onvif_discovery import (
+    _map_bounded,
+    _resolve_addresses,
+    check_camera_connectivity,
+    check_many,
+    get_onvif_stream_uri,
+    shared_onvif_cameras,
+    verify_many,
+    verify_onvif_camera,
+)
+
+
+def make_camera(media_service: MagicMock) -> MagicMock:
+    """Create a fake ONVIFCamera that returns the given media service."""
+    camera = MagicMock()
+    camera.create_media_service = AsyncMock(return_value=media_service)
+    camera.close = AsyncMock()
+    return camera
+
+
+class TestGetOnvifStreamUri:
+    """Tests for get_onvif_stream_uri."""
+
+    @pytest.mark.asyncio
+    async def test_returns_stream_uri(self, sample_onvif_config: OnvifCameraConfig) -> None:
+        """Test the URI of the first profile is returned."""
+        media_service = MagicMock()
+        media_service.GetProfiles = AsyncMock(return_value=[SimpleNamespace(token="profile_1")])
+        media_service.GetStreamUri = AsyncMock(return_value=SimpleNamespace(Uri="rtsp://cam/1"))
+        camera = make_camera(media_service)
+
+        with patch.object(onvif_discovery, "_open_camera", AsyncMock(return_value=camera)):
+            uri = await get_onvif_stream_uri(sample_onvif_config)
+
+        assert uri == "rtsp://cam/1"
+        media_service.GetStreamUri.assert_awaited_once_with(
+            {
+                "StreamSetup": {"Stream": "RTP-Unicast", "Transport": {"Protocol": "RTSP"}},
+                "ProfileToken": "profile_1",
+            }
+        )
+        camera.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_returns_none(
+        self, sample_onvif_config: OnvifCameraConfig
+    ) -> None:
+        """Test an HTTP error from the stream call is reported as None."""
+        media_service = MagicMock()
+        media_service.GetProfiles = AsyncMock(return_value=[SimpleNamespace(token="profile_1")])
+        media_service.GetStreamUri = AsyncMock(
+            side_effect=TransportError("Unauthorized", status_code=401)
+        )
+        camera = make_camera(media_service)
+
+        with patch.object(onvif_discovery, "_open_camera", AsyncMock(return_value=camera)):
+            uri = await get_onvif_stream_uri(sample_onvif_config)
+
+        assert uri is None
+        # HTTP errors are not retried
+        media_service.GetStreamUri.assert_awaited_once()
+
+
+def make_device_camera(manufacturer: str = "AXIS") -> MagicMock:
+    """Create a fake ONVIFCamera whose device service reports `manufacturer`."""
+    device_service = MagicMock()
+    device_service.GetDeviceInformation = AsyncMock(
+        return_value=SimpleNamespace(
+            Manufacturer=manufacturer,
+            Model="P3245-LV",
+            FirmwareVersion="11.8.64",
+            SerialNumber="ACCC8E123456",
+            HardwareId="1234",
+        )
+    )
+    camera = MagicMock()
+    camera.create_devicemgmt_service = AsyncMock(return_value=device_service)
+    camera.close = AsyncMock()
+    return camera
+
+
+class TestSharedOnvifCameras:
+    """Tests for the shared_onvif_cameras() context."""
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_camera(self, sample_onvif_config: OnvifCameraConfig) -> None:
+        """Test concurrent calls in the block open the camera once and close it on exit."""
+        camera = make_device_camera()
+        open_camera = AsyncMock(return_value=camera)
+
+        with patch.object(onvif_discovery, "_open_camera", open_camera):
+            async with shared_onvif_cameras():
+                async with shared_onvif_cameras():
+                    results = await asyncio.gather(
+                        verify_onvif_camera(sample_onvif_config),
+                        verify_onvif_camera(sample_onvif_config),
+                    )
+                camera.close.assert_not_awaited()
+
+        assert all(info.is_accessible for info in results)
+        open_camera.assert_awaited_once()
+        camera.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_shared_camera_probes_once(self, sample_onvif_config: OnvifCameraConfig) -> None:
+        """Test the reachability preflight runs once for calls sharing a camera."""
+        camera = make_device_camera()
+        camera.update_xaddrs = AsyncMock()
+        media_service = MagicMock()
+        media_service.GetProfiles = AsyncMock(return_value=[SimpleNamespace(token="profile_1")])
+        media_service.GetStreamUri = AsyncMock(return_value=SimpleNamespace(Uri="rtsp://cam/1"))
+        camera.create_media_service = AsyncMock(return_value=media_service)
+        check = AsyncMock(return_value=True)
+
+        with (
+            patch.object(onvif_discovery, "check_camera_connectivity", check),
+            patch.object(onvif_discovery, "ONVIFCamera", return_value=camera),
+        ):
+            async with shared_onvif_cameras():
+                info, uri = await asyncio.gather(
+                    verify_onvif_camera(sample_onvif_config),
+                    get_onvif_stream_uri(sample_onvif_config),
+                )
+
+        assert info.is_accessible
+        assert uri == "rtsp://cam/1"
+        check.assert_awaited_once_with(sample_onvif_config.ip_address, sample_onvif_config.port)
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_block_open_own_camera(
+        self, sample_onvif_config: OnvifCameraConfig
+    ) -> None:
+        """Test each call outside the block opens and closes its own camera."""
+        camera = make_device_camera()
+        open_camera = AsyncMock(return_value=camera)
+
+        with patch.object(onvif_discovery, "_open_camera", open_camera):
+            await verify_onvif_camera(sample_onvif_config)
+            await verify_onvif_camera(sample_onvif_config)
+
+        assert open_camera.await_count == 2
+        assert camera.close.await_count == 2
+
+
+class TestBatchHelpers:
+    """Tests for verify_many, check_many and the bounded worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_map_bounded_keeps_order_and_cap(self) -> None:
+        """Test results keep input order and at most `concurrency` calls run at once."""
+        in_flight = peak = 0
+
+        async def _double(value: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later items finish first, so completion order differs from input order
+            await asyncio.sleep(0.001 * (20 - value))
+            in_flight -= 1
+            return value * 2
+
+        results = await _map_bounded(_double, list(range(20)), 4)
+
+        assert results == [value * 2 for value in range(20)]
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_map_bounded_empty(self) -> None:
+        """Test an empty input starts no workers."""
+        assert await _map_bounded(AsyncMock(), [], 4) == []
+
+    @pytest.mark.asyncio
+    async def test_verify_many_isolates_failures(self) -> None:
+        """Test an unreachable and a hung camera do not affect the others."""
+        configs = [
+            OnvifCameraConfig(address=f"192.168.1.{i}", username="admin", password="pass")
+            for i in (10, 11, 12)
+        ]
+
+        async def _open(config: OnvifCameraConfig, timeout: float) -> MagicMock:
+            if config.ip_address == "192.168.1.11":
+                raise ConnectionError("Camera not reachable at 192.168.1.11:80")
+            if config.ip_address == "192.168.1.12":
+                await asyncio.sleep(10)
+            return make_device_camera(config.ip_address)
+
+        with patch.object(onvif_discovery, "_open_camera", _open):
+            results = await verify_many(configs, concurrency=2, timeout=0.05)
+
+        assert results[0].is_accessible
+        assert results[0].manufacturer == "192.168.1.10"
+        assert not results[1].is_accessible
+        assert "not reachable" in (results[1].error or "")
+        assert not results[2].is_accessible
+        assert results[2].error == "Timed out after 0.05s"
+
+    @pytest.mark.asyncio
+    async def test_check_many_keeps_order(self) -> None:
+        """Test check_many reports reachability per address, in order."""
+
+        async def _check(ip_address: str, port: int) -> bool:
+            return ip_address.endswith(".10")
+
+        with patch.object(onvif_discovery, "check_camera_connectivity", _check):
+            results = await check_many(["192.168.1.10", "192.168.1.11", "10.0.0.10"])
+
+        assert results == [True, False, True]
+
+
+class TestCheckCameraConnectivity:
+    """Tests for the concurrent-address reachability probe."""
+
+    @pytest.mark.asyncio
+    async def test_fastest_address_wins(self) -> None:
+        """Test a hung IPv6 address does not delay a reachable IPv4 one."""
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def _try_connect(family: int, address: tuple[str, int]) -> bool:
+            started.append(address[0])
+            if family == socket.AF_INET6:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(address[0])
+                    raise
+            return True
+
+        addresses = [
+            (socket.AF_INET6, ("2001:db8::10", 80)),
+            (socket.AF_INET, ("192.168.1.10", 80)),
+        ]
+        with (
+            patch.object(onvif_discovery, "_resolve_addresses", AsyncMock(return_value=addresses)),
+            patch.object(onvif_discovery, "_try_connect", _try_connect),
+        ):
+            assert await asyncio.wait_for(check_camera_connectivity("camera.local"), 1.0)
+            await asyncio.sleep(0)
+
+        assert started == ["2001:db8::10", "192.168.1.10"]
+        assert cancelled == ["2001:db8::10"]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_when_all_addresses_fail(self) -> None:
+        """Test the probe fails when no address accepts a connection."""
+        addresses = [
+            (socket.AF_INET6, ("2001:db8::10", 80)),
+            (socket.AF_INET, ("192.168.1.10", 80)),
+        ]
+        with (
+            patch.object(onvif_discovery, "_resolve_addresses", AsyncMock(return_value=addresses)),
+            patch.object(onvif_discovery, "_try_connect", AsyncMock(return_value=False)),
+        ):
+            assert not await check_camera_connectivity("camera.local")
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_host(self) -> None:
+        """Test a resolver error is reported as unreachable."""
+        with patch.object(
+            onvif_discovery,
+            "_resolve_addresses",
+            AsyncMock(side_effect=socket.gaierror("Name or service not known")),
+        ):
+            assert not await check_camera_connectivity("missing.invalid")
+
+    @pytest.mark.asyncio
+    async def test_ip_literals_skip_resolver(self) -> None:
+        """Test IP addresses are used as-is without a getaddrinfo call."""
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "getaddrinfo", AsyncMock()) as getaddrinfo:
+            assert await _resolve_addresses("192.168.1.10", 80) == [
+                (socket.AF_INET, ("192.168.1.10", 80))
+            ]
+            assert await _resolve_addresses("2001:db8::10", 80) == [
+                (socket.AF_INET6, ("2001:db8::10", 80))
+            ]
+
+        getaddrinfo.assert_not_awaited()